@@ -32,8 +32,8 @@ _last_refresh = None
 # Metric definitions with mapping to both historical and real-time files
 EMISSIONS_METRICS = {
     "travel": {
-        "realtime_file": "company_travel_emissions_daily.csv",
-        "historical_file": "company_travel_emissions_daily_clean.csv",
+        "realtime_file": "company_travel_emissions_daily.parquet",
+        "historical_file": "company_travel_emissions_daily_clean.parquet",
         "name": "Travel Emissions",
         "unit": "kg CO₂e",
         "description": "Company travel emissions from air and ground transport",
@@ -41,8 +41,8 @@ EMISSIONS_METRICS = {
         "value_field": "travel_tco2e"
     },
     "production": {
-        "realtime_file": "production_emissions_daily.csv",
-        "historical_file": "company_production_emissions_daily_clean.csv",
+        "realtime_file": "production_emissions_daily.parquet",
+        "historical_file": "company_production_emissions_daily_clean.parquet",
         "name": "Production Emissions",
         "unit": "kg CO₂e",
         "description": "Direct and indirect emissions from production activities",
@@ -50,8 +50,8 @@ EMISSIONS_METRICS = {
         "value_field": "total_emissions_kg"
     },
     "energy": {
-        "realtime_file": "energy_consumption_daily.csv",
-        "historical_file": "company_energy_consumption_daily_clean.csv",
+        "realtime_file": "energy_consumption_daily.parquet",
+        "historical_file": "company_energy_consumption_daily_clean.parquet",
         "name": "Energy Consumption",
         "unit": "kWh",
         "description": "Daily energy consumption across all sources",
@@ -59,8 +59,8 @@ EMISSIONS_METRICS = {
         "value_field": "total_kwh"
     },
     "water": {
-        "realtime_file": "water_usage_daily.csv",
-        "historical_file": "company_water_usage_daily_clean.csv",
+        "realtime_file": "water_usage_daily.parquet",
+        "historical_file": "company_water_usage_daily_clean.parquet",
         "name": "Water Usage",
         "unit": "liters",
         "description": "Total water consumption and recycling metrics",
@@ -68,8 +68,8 @@ EMISSIONS_METRICS = {
         "value_field": "total_consumption_liters"
     },
     "air_quality": {
-        "realtime_file": "air_quality_monitoring_daily.csv",
-        "historical_file": "factory_air_quality_daily_clean.csv",
+        "realtime_file": "air_quality_monitoring_daily.parquet",
+        "historical_file": "factory_air_quality_daily_clean.parquet",
         "name": "Air Quality",
         "unit": "AQI",
         "description": "Air quality monitoring including PM2.5, PM10, and other pollutants",
@@ -77,8 +77,8 @@ EMISSIONS_METRICS = {
         "value_field": "aqi_score"
     },
     "energy_mix": {
-        "realtime_file": "energy_mix_monthly.csv",
-        "historical_file": "company_energy_mix_monthly_clean.csv",
+        "realtime_file": "energy_mix_monthly.parquet",
+        "historical_file": "company_energy_mix_monthly_clean.parquet",
         "name": "Energy Mix",
         "unit": "%",
         "description": "Breakdown of renewable vs fossil fuel energy sources",
@@ -86,8 +86,8 @@ EMISSIONS_METRICS = {
         "value_field": "renewable_total_percent"
     },
     "waste": {
-        "realtime_file": "waste_management_monthly.csv",
-        "historical_file": "company_waste_monthly_clean.csv",
+        "realtime_file": "waste_management_monthly.parquet",
+        "historical_file": "company_waste_monthly_clean.parquet",
         "name": "Waste Management",
         "unit": "kg",
         "description": "Waste generation, recycling, and disposal metrics",
@@ -97,7 +97,7 @@ EMISSIONS_METRICS = {
 }
 
 def load_metric(metric_key: str) -> Optional[pd.DataFrame]:
-    """Load a specific metric from both historical and real-time CSV files"""
+    """Load a specific metric from both historical and real-time data files"""
     try:
         metric_info = EMISSIONS_METRICS.get(metric_key)
         if not metric_info:
@@ -107,15 +107,30 @@ def load_metric(metric_key: str) -> Optional[pd.DataFrame]:
         
         # Load historical data
         historical_path = HISTORICAL_DIR / metric_info["historical_file"]
+        if not historical_path.exists():
+            # Fall back to cleaner output written with --format csv
+            historical_path = historical_path.with_suffix(".csv")
         if historical_path.exists():
-            df_historical = pd.read_csv(historical_path)
+            if historical_path.suffix == ".parquet":
+                df_historical = pd.read_parquet(historical_path)
+                # Parquet keeps datetime64; match the string dates in the real-time CSVs
+                if "date" in df_historical.columns:
+                    df_historical["date"] = df_historical["date"].dt.strftime("%Y-%m-%d")
+            else:
+                df_historical = pd.read_csv(historical_path)
             dfs.append(df_historical)
             print(f"  📊 Loaded {len(df_historical)} historical rows for {metric_key}")
         
         # Load real-time data
         realtime_path = REALTIME_DIR / metric_info["realtime_file"]
+        if not realtime_path.exists():
+            # Fall back to the CSV written by older generator versions
+            realtime_path = realtime_path.with_suffix(".csv")
         if realtime_path.exists():
-            df_realtime = pd.read_csv(realtime_path)
+            if realtime_path.suffix == ".parquet":
+                df_realtime = pd.read_parquet(realtime_path)
+            else:
+                df_realtime = pd.read_csv(realtime_path)
             dfs.append(df_realtime)
             print(f"  ⚡ Loaded {len(df_realtime)} real-time rows for {metric_key}")
         
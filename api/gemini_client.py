@@ -87,6 +87,47 @@ class GeminiClient:
             print(f"❌ Error generating text: {e}")
             raise
     
+    async def agenerate_text(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_output_tokens: int = 2048,
+        top_p: float = 0.95,
+        top_k: int = 40
+    ) -> str:
+        """
+        Async variant of generate_text; does not block the event loop while
+        waiting on Vertex AI, so concurrent requests overlap
+        
+        Args:
+            prompt: Input prompt
+            temperature: Creativity (0.0-1.0)
+            max_output_tokens: Maximum response length
+            top_p: Nucleus sampling threshold
+            top_k: Top-k sampling parameter
+            
+        Returns:
+            Generated text response
+        """
+        try:
+            generation_config = {
+                "temperature": temperature,
+                "max_output_tokens": max_output_tokens,
+                "top_p": top_p,
+                "top_k": top_k
+            }
+            
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config=generation_config
+            )
+            
+            return response.text
+            
+        except Exception as e:
+            print(f"❌ Error generating text: {e}")
+            raise
+    
     def start_chat(self, context: Optional[str] = None) -> ChatSession:
         """
         Start a new chat session with optional context
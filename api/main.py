@@ -56,12 +56,17 @@ def _load_clean_outputs() -> Dict[str, List[dict]]:
     datasets: Dict[str, List[dict]] = {}
     if not CLEAN_DIR.exists():
         return datasets
-    for csv_path in CLEAN_DIR.glob("*.csv"):
-        df = pd.read_csv(csv_path)
+    for data_path in sorted(CLEAN_DIR.iterdir()):
+        if data_path.suffix == ".parquet":
+            df = pd.read_parquet(data_path)
+        elif data_path.suffix == ".csv":
+            df = pd.read_csv(data_path)
+        else:
+            continue
         if "date" in df.columns:
             with suppress(Exception):
                 df["date"] = pd.to_datetime(df["date"]).dt.strftime("%Y-%m-%d")
-        datasets[csv_path.stem] = df.to_dict(orient="records")
+        datasets[data_path.stem] = df.to_dict(orient="records")
     return datasets
 
 
@@ -55,7 +55,11 @@ def get_db_connection():
     """Get database connection"""
     if not DB_PATH.exists():
         raise HTTPException(status_code=503, detail="Database not found. Run create_social_db.py first.")
-    return sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH)
+    # The database is built in WAL mode, so reads don't block a rebuild;
+    # memory-map it to serve pages without a read() per page
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
 
 def dict_factory(cursor, row):
     """Convert database row to dictionary"""
@@ -2,6 +2,7 @@
 Database Client for LLM Integration
 Fetches database metadata, schema, and sample data for LLM context
 """
+import os
 import sqlite3
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
@@ -26,10 +27,23 @@ class DatabaseClient:
         conn.row_factory = sqlite3.Row
         return conn
     
+    def get_version(self) -> Tuple[int, int]:
+        """
+        Modification times of the database and its WAL file (0 if absent)
+        
+        Writes to a WAL-mode database land in the -wal file first, so both
+        are needed to tell whether the contents may have changed.
+        """
+        wal_path = f"{self.db_path}-wal"
+        wal_mtime = os.stat(wal_path).st_mtime_ns if os.path.exists(wal_path) else 0
+        return os.stat(self.db_path).st_mtime_ns, wal_mtime
+    
     def get_table_names(self) -> List[str]:
         """
         Get all table names in the database
         
+        Internal bookkeeping tables (leading underscore) are excluded.
+        
         Returns:
             List of table names
         """
@@ -39,6 +53,8 @@ class DatabaseClient:
         cursor.execute("""
             SELECT name FROM sqlite_master 
             WHERE type='table' 
+            AND name NOT LIKE '\\_%' ESCAPE '\\'
+            AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\'
             ORDER BY name
         """)
         
@@ -22,8 +22,29 @@ class SQLPromptGenerator:
         Args:
             db_path: Path to SQLite database
         """
+        self.db_path = db_path
         self.db_client = DatabaseClient(db_path)
         self.db_name = self.db_client.db_name
+        # Database context per (database version, include_samples)
+        self._context_cache: Dict[tuple, str] = {}
+    
+    def get_db_context(self, include_samples: bool = True) -> str:
+        """
+        Get the database context, rebuilt only when the database or its WAL file changes
+        
+        Args:
+            include_samples: Whether to include sample data in context
+            
+        Returns:
+            Formatted string with database information
+        """
+        key = (self.db_client.get_version(), include_samples)
+        context = self._context_cache.get(key)
+        if context is None:
+            # Drop contexts built from an older version of the database
+            self._context_cache = {k: v for k, v in self._context_cache.items() if k[0] == key[0]}
+            context = self._context_cache[key] = self.db_client.get_llm_context(include_samples=include_samples)
+        return context
     
     def generate_sql_prompt(self, user_question: str, include_samples: bool = True) -> str:
         """
@@ -37,7 +58,7 @@ class SQLPromptGenerator:
             Complete prompt string for LLM
         """
         # Get database context
-        db_context = self.db_client.get_llm_context(include_samples=include_samples)
+        db_context = self.get_db_context(include_samples=include_samples)
         
         # Build the prompt
         prompt = f"""You are an expert SQL query generator. Your task is to convert natural language questions into valid SQLite queries.
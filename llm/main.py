@@ -4,7 +4,10 @@ Manages the flow: User Question → SQL Generation → Query Execution → Analy
 """
 import sys
 import os
+import asyncio
 import sqlite3
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
@@ -34,6 +37,13 @@ class TextToSQLOrchestrator:
         self.db_client = DatabaseClient(db_path)
         self.prompt_generator = SQLPromptGenerator(db_path)
         self.gemini_client = GeminiClient(project_id=project_id, location=location)
+        self._examples = self.prompt_generator.get_example_questions()
+        
+        # SQL -> (columns, row tuples), keyed on (db version, sql) so a changed DB
+        # invalidates entries; rows stay immutable and callers get fresh dicts
+        self._query_cache: "OrderedDict[Tuple[Tuple[int, int], str], Tuple[List[str], List[tuple]]]" = OrderedDict()
+        self._query_cache_size = 128
+        self._query_cache_lock = threading.Lock()
         
         print(f"✅ Initialized Text-to-SQL for database: {self.db_client.db_name}")
     
@@ -100,6 +110,79 @@ class TextToSQLOrchestrator:
         
         return result
     
+    async def aprocess_question(self, user_question: str) -> Dict:
+        """
+        Async variant of process_question for concurrent callers
+        
+        Gemini calls are awaited and the SQLite query runs in a worker thread,
+        so many questions can be in flight on one event loop.
+        
+        Args:
+            user_question: User's natural language question
+            
+        Returns:
+            Dictionary with results and metadata
+        """
+        result = {
+            "question": user_question,
+            "success": False,
+            "error": None,
+            "sql_query": None,
+            "results": None,
+            "analysis": None,
+            "metadata": {}
+        }
+        
+        try:
+            sql_query = await self._agenerate_sql(user_question)
+            
+            if not sql_query:
+                result["error"] = "Failed to generate SQL query"
+                return result
+            
+            result["sql_query"] = sql_query
+            
+            query_results = await asyncio.to_thread(self._execute_query, sql_query)
+            
+            if query_results is None:
+                result["error"] = "Failed to execute query"
+                return result
+            
+            result["results"] = query_results
+            result["metadata"]["row_count"] = len(query_results)
+            
+            analysis = await self._agenerate_analysis(user_question, sql_query, query_results)
+            
+            if analysis:
+                result["analysis"] = analysis
+            
+            result["success"] = True
+            
+        except Exception as e:
+            result["error"] = str(e)
+            print(f"❌ Error: {e}")
+        
+        return result
+    
+    async def aprocess_many(self, questions: List[str], max_concurrency: int = 8) -> List[Dict]:
+        """
+        Process a batch of questions concurrently
+        
+        Args:
+            questions: Natural language questions
+            max_concurrency: Maximum number of questions in flight at once
+            
+        Returns:
+            Result dictionaries in the same order as questions
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(question: str) -> Dict:
+            async with semaphore:
+                return await self.aprocess_question(question)
+        
+        return await asyncio.gather(*(run(q) for q in questions))
+    
     def _generate_sql(self, user_question: str) -> Optional[str]:
         """
         Generate SQL query from user question
@@ -121,42 +204,85 @@ class TextToSQLOrchestrator:
                 max_output_tokens=500
             )
             
-            if not response:
-                return None
+            return self._clean_sql_response(response)
             
-            # Clean up response - remove markdown code blocks if present
-            sql_query = response.strip()
-            if sql_query.startswith("```sql"):
-                sql_query = sql_query[6:]
-            if sql_query.startswith("```"):
-                sql_query = sql_query[3:]
-            if sql_query.endswith("```"):
-                sql_query = sql_query[:-3]
-            
-            sql_query = sql_query.strip()
-            
-            # Remove any leading text before SELECT/WITH
-            lines = sql_query.split('\n')
-            for i, line in enumerate(lines):
-                line_upper = line.strip().upper()
-                if line_upper.startswith('SELECT') or line_upper.startswith('WITH'):
-                    sql_query = '\n'.join(lines[i:])
-                    break
+        except Exception as e:
+            print(f"❌ Error generating SQL: {e}")
+            return None
+    
+    async def _agenerate_sql(self, user_question: str) -> Optional[str]:
+        """
+        Async variant of _generate_sql
+        
+        Args:
+            user_question: User's question
             
-            sql_query = sql_query.strip()
+        Returns:
+            SQL query string or None
+        """
+        try:
+            # Rebuilding the database context on a cache miss queries SQLite,
+            # so keep it off the event loop like the query step
+            prompt = await asyncio.to_thread(
+                self.prompt_generator.generate_sql_prompt,
+                user_question,
+                include_samples=True
+            )
             
-            # Basic validation - should start with SELECT or WITH
-            if not any(sql_query.upper().startswith(cmd) for cmd in ["SELECT", "WITH"]):
-                print(f"⚠️  Warning: Query doesn't start with SELECT or WITH")
-                print(f"Raw response: {response[:200]}")
-                return None
+            response = await self.gemini_client.agenerate_text(
+                prompt=prompt,
+                temperature=0.1,
+                max_output_tokens=500
+            )
             
-            return sql_query
+            return self._clean_sql_response(response)
             
         except Exception as e:
             print(f"❌ Error generating SQL: {e}")
             return None
     
+    def _clean_sql_response(self, response: Optional[str]) -> Optional[str]:
+        """
+        Extract the SQL statement from a raw LLM response
+        
+        Args:
+            response: Raw model output
+            
+        Returns:
+            SQL query string or None
+        """
+        if not response:
+            return None
+        
+        # Clean up response - remove markdown code blocks if present
+        sql_query = response.strip()
+        if sql_query.startswith("```sql"):
+            sql_query = sql_query[6:]
+        if sql_query.startswith("```"):
+            sql_query = sql_query[3:]
+        if sql_query.endswith("```"):
+            sql_query = sql_query[:-3]
+        
+        sql_query = sql_query.strip()
+        
+        # Remove any leading text before SELECT/WITH
+        lines = sql_query.split('\n')
+        for i, line in enumerate(lines):
+            line_upper = line.strip().upper()
+            if line_upper.startswith('SELECT') or line_upper.startswith('WITH'):
+                sql_query = '\n'.join(lines[i:])
+                break
+        
+        sql_query = sql_query.strip()
+        
+        # Basic validation - should start with SELECT or WITH
+        if not any(sql_query.upper().startswith(cmd) for cmd in ["SELECT", "WITH"]):
+            print(f"⚠️  Warning: Query doesn't start with SELECT or WITH")
+            print(f"Raw response: {response[:200]}")
+            return None
+        
+        return sql_query
+    
     def _execute_query(self, sql_query: str) -> Optional[List[Dict]]:
         """
         Execute SQL query safely
@@ -173,21 +299,43 @@ class TextToSQLOrchestrator:
                 print(f"❌ Only SELECT queries are allowed")
                 return None
             
+            key = (self.db_client.get_version(), sql_query)
+            with self._query_cache_lock:
+                cached = self._query_cache.get(key)
+                if cached is not None:
+                    self._query_cache.move_to_end(key)
+            
+            if cached is not None:
+                columns, rows = cached
+                return [dict(zip(columns, row)) for row in rows]
+            
             conn = self.db_client.get_connection()
+            # Plain tuples are cheaper than sqlite3.Row; keys come from the description
+            conn.row_factory = None
             cursor = conn.cursor()
             
             # Execute query
             cursor.execute(sql_query)
+            columns = [d[0] for d in cursor.description]
             
-            # Fetch results
-            rows = cursor.fetchall()
-            
-            # Convert to list of dictionaries
-            results = [dict(row) for row in rows]
+            # Fetch results in batches
+            rows = []
+            while True:
+                batch = cursor.fetchmany(1000)
+                if not batch:
+                    break
+                rows.extend(batch)
             
             conn.close()
             
-            return results
+            with self._query_cache_lock:
+                self._query_cache[key] = (columns, rows)
+                self._query_cache.move_to_end(key)
+                if len(self._query_cache) > self._query_cache_size:
+                    self._query_cache.popitem(last=False)
+            
+            # Convert to list of dictionaries
+            return [dict(zip(columns, row)) for row in rows]
             
         except sqlite3.Error as e:
             print(f"❌ SQL Error: {e}")
@@ -224,14 +372,43 @@ class TextToSQLOrchestrator:
             )
             
             return response
+        
+        except Exception as e:
+            print(f"❌ Error generating analysis: {e}")
+            return None
+    
+    async def _agenerate_analysis(self, user_question: str, sql_query: str, results: List[Dict]) -> Optional[str]:
+        """
+        Async variant of _generate_analysis
+        
+        Args:
+            user_question: Original question
+            sql_query: SQL query executed
+            results: Query results
+        
+        Returns:
+            Analysis text or None
+        """
+        try:
+            prompt = self.prompt_generator.generate_analysis_prompt(
+                user_question,
+                sql_query,
+                results
+            )
             
+            return await self.gemini_client.agenerate_text(
+                prompt=prompt,
+                temperature=0.7,
+                max_output_tokens=500
+            )
+        
         except Exception as e:
             print(f"❌ Error generating analysis: {e}")
             return None
     
     def get_example_questions(self) -> List[str]:
         """Get example questions for this database"""
-        return self.prompt_generator.get_example_questions()
+        return self._examples
     
     def print_result(self, result: Dict):
         """Pretty print the result"""
@@ -38,34 +38,31 @@ def parse_uri(uri: str) -> Tuple[str, str]:
     return '', uri
 
 
-NUMERIC_RE = re.compile(r"[-+]?\d*\.?\d+")
+NUMERIC_RE = re.compile(r"([-+]?\d*\.?\d+)")
 
 
-def _extract_number(text: str) -> float:
-    match = NUMERIC_RE.search(text.replace(',', ''))
-    return float(match.group()) if match else np.nan
+def _unit_pattern(unit_map: Dict[str, float]) -> re.Pattern:
+    return re.compile('(' + '|'.join(re.escape(key) for key in unit_map) + ')', re.IGNORECASE)
+
+
+DATE_FORMAT = '%Y-%m-%d'
+
+
+def _parse_dates(df: pd.DataFrame) -> pd.DataFrame:
+    df['date'] = pd.to_datetime(df['date'], format=DATE_FORMAT, errors='coerce', cache=True)
+    return df
 
 
 def parse_numeric(series: pd.Series, unit_map: Dict[str, float] | None = None, percent: bool = False) -> pd.Series:
-    def convert(value) -> float:
-        if pd.isna(value):
-            return np.nan
-        text = str(value)
-        factor = 1.0
-        if unit_map:
-            text_lower = text.lower()
-            for key, multiplier in unit_map.items():
-                if key in text_lower:
-                    factor = multiplier
-                    break
-        num = _extract_number(text)
-        if np.isnan(num):
-            return np.nan
-        if percent:
-            return num / 100.0
-        return num * factor
-
-    return series.apply(convert)
+    text = series.astype(str)
+    numbers = text.str.replace(',', '', regex=False).str.extract(NUMERIC_RE, expand=False).astype(float)
+    numbers = numbers.mask(series.isna())
+    if percent:
+        return numbers / 100.0
+    if unit_map:
+        units = text.str.extract(_unit_pattern(unit_map), expand=False).str.lower()
+        numbers = numbers * units.map(unit_map).fillna(1.0)
+    return numbers
 
 
 def finalize_time_series(df: pd.DataFrame, frequency: str, integer_cols: Iterable[str] = ()) -> pd.DataFrame:
@@ -74,7 +71,8 @@ def finalize_time_series(df: pd.DataFrame, frequency: str, integer_cols: Iterabl
     df = df.reindex(full_index)
     df.index.name = 'date'
     numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    if numeric_cols:
+    # Interpolation is the costliest step; skip it when nothing is missing.
+    if numeric_cols and df[numeric_cols].isna().to_numpy().any():
         df[numeric_cols] = df[numeric_cols].interpolate(limit_direction='both')
         df[numeric_cols] = df[numeric_cols].bfill().ffill()
     non_numeric_cols = [col for col in df.columns if col not in numeric_cols]
@@ -87,7 +85,7 @@ def finalize_time_series(df: pd.DataFrame, frequency: str, integer_cols: Iterabl
 
 
 def clean_travel(df: pd.DataFrame) -> pd.DataFrame:
-    df['date'] = pd.to_datetime(df['date'])
+    df = _parse_dates(df)
     default = pd.Series(np.nan, index=df.index)
     df['flights'] = parse_numeric(df.get('flights', default), percent=False).round()
     df['road_trips'] = parse_numeric(df.get('road_trips', default), percent=False).round()
@@ -100,7 +98,7 @@ def clean_travel(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def clean_production(df: pd.DataFrame) -> pd.DataFrame:
-    df['date'] = pd.to_datetime(df['date'])
+    df = _parse_dates(df)
     default = pd.Series(np.nan, index=df.index)
     units = parse_numeric(df.get('production_units', default))
     intensity = parse_numeric(df.get('emission_intensity_tco2e_per_unit', default))
@@ -120,7 +118,7 @@ def clean_production(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def clean_energy_daily(df: pd.DataFrame) -> pd.DataFrame:
-    df['date'] = pd.to_datetime(df['date'])
+    df = _parse_dates(df)
     default = pd.Series(np.nan, index=df.index)
     electricity = parse_numeric(df.get('electricity_kwh', default), unit_map={'mwh': 1000.0, 'kwh': 1.0})
     gas = parse_numeric(df.get('natural_gas_mwh', default), unit_map={'mwh': 1.0})
@@ -140,7 +138,7 @@ def clean_energy_daily(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def clean_energy_mix(df: pd.DataFrame) -> pd.DataFrame:
-    df['date'] = pd.to_datetime(df['date'])
+    df = _parse_dates(df)
     default = pd.Series(np.nan, index=df.index)
     renewable = parse_numeric(df.get('renewable_share', default), percent=True)
     non_renewable = parse_numeric(df.get('non_renewable_share', default), percent=True)
@@ -157,7 +155,7 @@ def clean_energy_mix(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def clean_water(df: pd.DataFrame) -> pd.DataFrame:
-    df['date'] = pd.to_datetime(df['date'])
+    df = _parse_dates(df)
     default = pd.Series(np.nan, index=df.index)
     withdrawn = parse_numeric(df.get('water_withdrawn_m3', default), unit_map={'l': 1 / 1000.0})
     recycled = parse_numeric(df.get('water_recycled_m3', default), unit_map={'l': 1 / 1000.0})
@@ -177,7 +175,7 @@ def clean_water(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def clean_waste(df: pd.DataFrame) -> pd.DataFrame:
-    df['date'] = pd.to_datetime(df['date'])
+    df = _parse_dates(df)
     default = pd.Series(np.nan, index=df.index)
     hazardous = parse_numeric(df.get('hazardous_waste_tons', default), unit_map={'kg': 1 / 1000.0, 't': 1.0})
     non_hazardous = parse_numeric(df.get('non_hazardous_waste_tons', default), unit_map={'kg': 1 / 1000.0, 't': 1.0})
@@ -196,7 +194,7 @@ def clean_waste(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def clean_air_quality(df: pd.DataFrame) -> pd.DataFrame:
-    df['date'] = pd.to_datetime(df['date'])
+    df = _parse_dates(df)
     default = pd.Series(np.nan, index=df.index)
     aqi = parse_numeric(df.get('aqi', default))
     pm25 = parse_numeric(df.get('pm25_ugm3', default))
@@ -221,91 +219,136 @@ def clean_air_quality(df: pd.DataFrame) -> pd.DataFrame:
         'source_tag': 'synthetic_air_quality_v1_cleaned'
     })
     df_clean = finalize_time_series(df_clean, 'D')
-    df_clean[['aqi', 'pm25_ugm3', 'pm10_ugm3', 'no2_ppb', 'co_ppm']] = df_clean[['aqi', 'pm25_ugm3', 'pm10_ugm3', 'no2_ppb', 'co_ppm']].clip(lower=0)
+    pollutant_cols = ['aqi', 'pm25_ugm3', 'pm10_ugm3', 'no2_ppb', 'co_ppm']
+    # Column selection already yields a fresh float64 block; clip it in place
+    # rather than letting DataFrame.clip allocate a second frame.
+    pollutants = df_clean[pollutant_cols].to_numpy(dtype=float)
+    np.clip(pollutants, 0, None, out=pollutants)
+    df_clean[pollutant_cols] = pollutants
     return df_clean
 
 
 HANDLERS = [
-    DatasetHandler('company_travel_emissions_daily_messy.csv', 'company_travel_emissions_daily_clean.csv', 'D', clean_travel),
-    DatasetHandler('company_production_emissions_daily_messy.csv', 'company_production_emissions_daily_clean.csv', 'D', clean_production),
-    DatasetHandler('company_energy_consumption_daily_messy.csv', 'company_energy_consumption_daily_clean.csv', 'D', clean_energy_daily),
-    DatasetHandler('company_energy_mix_monthly_messy.csv', 'company_energy_mix_monthly_clean.csv', 'MS', clean_energy_mix),
-    DatasetHandler('company_water_usage_daily_messy.csv', 'company_water_usage_daily_clean.csv', 'D', clean_water),
-    DatasetHandler('company_waste_monthly_messy.csv', 'company_waste_monthly_clean.csv', 'MS', clean_waste),
-    DatasetHandler('factory_air_quality_daily_messy.csv', 'factory_air_quality_daily_clean.csv', 'D', clean_air_quality),
+    DatasetHandler('company_travel_emissions_daily_messy.parquet', 'company_travel_emissions_daily_clean.parquet', 'D', clean_travel),
+    DatasetHandler('company_production_emissions_daily_messy.parquet', 'company_production_emissions_daily_clean.parquet', 'D', clean_production),
+    DatasetHandler('company_energy_consumption_daily_messy.parquet', 'company_energy_consumption_daily_clean.parquet', 'D', clean_energy_daily),
+    DatasetHandler('company_energy_mix_monthly_messy.parquet', 'company_energy_mix_monthly_clean.parquet', 'MS', clean_energy_mix),
+    DatasetHandler('company_water_usage_daily_messy.parquet', 'company_water_usage_daily_clean.parquet', 'D', clean_water),
+    DatasetHandler('company_waste_monthly_messy.parquet', 'company_waste_monthly_clean.parquet', 'MS', clean_waste),
+    DatasetHandler('factory_air_quality_daily_messy.parquet', 'factory_air_quality_daily_clean.parquet', 'D', clean_air_quality),
 ]
 
 
+OUTPUT_FORMATS = ('parquet', 'csv')
+
+# Messy inputs are read as Parquet, falling back to CSV from older generator runs.
+INPUT_FORMATS = ('parquet', 'csv')
+
+
+def input_names(handler: DatasetHandler) -> list[str]:
+    return [Path(handler.input_name).with_suffix(f'.{input_format}').name for input_format in INPUT_FORMATS]
+
+
+def output_name(handler: DatasetHandler, output_format: str) -> str:
+    return Path(handler.output_name).with_suffix(f'.{output_format}').name
+
+
+def read_dataframe(source, name: str) -> pd.DataFrame:
+    if name.endswith('.parquet'):
+        return pd.read_parquet(source)
+    return pd.read_csv(source)
+
+
+def serialize_dataframe(df: pd.DataFrame, output_format: str) -> Tuple[bytes, str]:
+    if output_format == 'parquet':
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, compression='snappy', index=False)
+        return buffer.getvalue(), 'application/octet-stream'
+    return df.to_csv(index=False).encode('utf-8'), 'text/csv'
+
+
 def download_dataframe(path: Path) -> pd.DataFrame:
-    return pd.read_csv(path)
+    return read_dataframe(path, path.name)
 
 
 def download_gcs_dataframe(client: storage.Client, bucket_name: str, blob_name: str) -> pd.DataFrame:
     bucket = client.bucket(bucket_name)
     blob = bucket.blob(blob_name)
     data = blob.download_as_bytes()
-    return pd.read_csv(io.BytesIO(data))
+    return read_dataframe(io.BytesIO(data), blob_name)
 
 
 def upload_dataframe(df: pd.DataFrame, destination: Path) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(destination, index=False)
+    if destination.suffix == '.parquet':
+        df.to_parquet(destination, compression='snappy', index=False)
+    else:
+        df.to_csv(destination, index=False)
 
 
 def upload_gcs_dataframe(client: storage.Client, bucket_name: str, blob_name: str, df: pd.DataFrame) -> None:
     bucket = client.bucket(bucket_name)
     blob = bucket.blob(blob_name)
-    blob.upload_from_string(df.to_csv(index=False), content_type='text/csv')
+    output_format = Path(blob_name).suffix.lstrip('.') or 'csv'
+    payload, content_type = serialize_dataframe(df, output_format)
+    blob.upload_from_string(payload, content_type=content_type)
 
 
-def run_local(input_dir: Path, output_dir: Path) -> None:
+def run_local(input_dir: Path, output_dir: Path, output_format: str = 'parquet') -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
     for handler in HANDLERS:
-        source_path = input_dir / handler.input_name
-        if not source_path.exists():
-            print(f"[WARN] Missing local file: {source_path}")
+        candidates = [input_dir / name for name in input_names(handler)]
+        source_path = next((path for path in candidates if path.exists()), None)
+        if source_path is None:
+            print(f"[WARN] Missing local file: {candidates[0]}")
             continue
         df = download_dataframe(source_path)
         cleaned = handler.cleaner(df)
-        upload_dataframe(cleaned, output_dir / handler.output_name)
-        print(f"Wrote cleaned dataset: {output_dir / handler.output_name} ({len(cleaned)} rows)")
+        destination = output_dir / output_name(handler, output_format)
+        upload_dataframe(cleaned, destination)
+        print(f"Wrote cleaned dataset: {destination} ({len(cleaned)} rows)")
 
 
-def run_gcs(source_uri: str, target_uri: str) -> None:
+def run_gcs(source_uri: str, target_uri: str, output_format: str = 'parquet') -> None:
     src_bucket, src_prefix = parse_uri(source_uri)
     tgt_bucket, tgt_prefix = parse_uri(target_uri)
     client = storage.Client()
 
     for handler in HANDLERS:
-        blob_name = '/'.join(filter(None, [src_prefix, handler.input_name]))
-        try:
-            df = download_gcs_dataframe(client, src_bucket, blob_name)
-        except Exception as exc:
-            print(f"[WARN] Failed to download gs://{src_bucket}/{blob_name}: {exc}")
+        for name in input_names(handler):
+            blob_name = '/'.join(filter(None, [src_prefix, name]))
+            try:
+                df = download_gcs_dataframe(client, src_bucket, blob_name)
+                break
+            except Exception as exc:
+                error = f"[WARN] Failed to download gs://{src_bucket}/{blob_name}: {exc}"
+        else:
+            print(error)
             continue
         cleaned = handler.cleaner(df)
-        target_blob = '/'.join(filter(None, [tgt_prefix, handler.output_name]))
+        target_blob = '/'.join(filter(None, [tgt_prefix, output_name(handler, output_format)]))
         upload_gcs_dataframe(client, tgt_bucket, target_blob, cleaned)
         print(f"Uploaded cleaned dataset: gs://{tgt_bucket}/{target_blob} ({len(cleaned)} rows)")
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Clean messy ESG datasets and upload normalized outputs.')
-    parser.add_argument('--input-uri', required=True, help='Input directory or gs://bucket/prefix containing messy CSV files.')
-    parser.add_argument('--output-uri', required=True, help='Output directory or gs://bucket/prefix for cleaned CSV files.')
+    parser.add_argument('--input-uri', required=True, help='Input directory or gs://bucket/prefix containing messy Parquet or CSV files.')
+    parser.add_argument('--output-uri', required=True, help='Output directory or gs://bucket/prefix for cleaned files.')
+    parser.add_argument('--format', dest='output_format', choices=OUTPUT_FORMATS, default='parquet', help='File format for cleaned outputs (default: parquet).')
     return parser.parse_args()
 
 
-def clean_datasets(input_uri: str, output_uri: str) -> None:
+def clean_datasets(input_uri: str, output_uri: str, output_format: str = 'parquet') -> None:
     if input_uri.startswith('gs://') and output_uri.startswith('gs://'):
-        run_gcs(input_uri, output_uri)
+        run_gcs(input_uri, output_uri, output_format)
     else:
-        run_local(Path(input_uri), Path(output_uri))
+        run_local(Path(input_uri), Path(output_uri), output_format)
 
 
 def main() -> None:
     args = parse_args()
-    clean_datasets(args.input_uri, args.output_uri)
+    clean_datasets(args.input_uri, args.output_uri, args.output_format)
 
 
 if __name__ == '__main__':
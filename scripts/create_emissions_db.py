@@ -3,69 +3,73 @@ Create SQLite database from emissions CSV files
 Combines all 7 emissions metrics into a single database
 """
 import pandas as pd
-import sqlite3
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
 import numpy as np
 
+from sqlite_utils import connect, write_table
+
 # Paths
 DATASET_DIR = Path("dataset_realtime/emissions")
 DB_PATH = "emissions_data.db"
 
-def generate_historical_data():
+def generate_historical_data(seed=None):
     """Generate historical emissions data for the past year"""
     print("📊 Generating historical emissions data for the past year...")
     
+    rng = np.random.default_rng(seed)
+    
     # Generate dates for the past year (daily data)
     end_date = datetime.now()
     start_date = end_date - timedelta(days=365)
     dates = pd.date_range(start=start_date, end=end_date, freq='D')
+    n = len(dates)
     
-    # Initialize the main dataframe
-    df = pd.DataFrame({
-        'date': dates.strftime('%Y-%m-%d').tolist(),
-        'timestamp': dates
-    })
+    # Synthetic demo data needs no double precision; draw float32 throughout
+    def uniform(low, high):
+        return np.float32(low) + np.float32(high - low) * rng.random(n, dtype=np.float32)
     
-    # 1. Travel Emissions (kg CO2e)
-    df['travel_emissions'] = np.random.uniform(0, 50, len(dates))  # Low due to remote work
+    def normal(scale):
+        return np.float32(scale) * rng.standard_normal(n, dtype=np.float32)
     
     # 2. Production Emissions (kg CO2e) - with slight upward trend
     base_production = 6000
-    trend = np.linspace(0, 1500, len(dates))  # Gradual increase
-    noise = np.random.normal(0, 500, len(dates))
-    df['production_emissions'] = base_production + trend + noise
-    df['production_emissions'] = df['production_emissions'].clip(lower=4000)
+    trend = np.linspace(0, 1500, n, dtype=np.float32)  # Gradual increase
+    production = np.clip(base_production + trend + normal(500), 4000, None)
     
     # 3. Energy Consumption (kWh)
     base_energy = 35000
-    seasonal = 5000 * np.sin(np.linspace(0, 4*np.pi, len(dates)))  # Seasonal variation
-    noise_energy = np.random.normal(0, 2000, len(dates))
-    df['energy_consumption'] = base_energy + seasonal + noise_energy
-    df['energy_consumption'] = df['energy_consumption'].clip(lower=25000)
-    
-    # 4. Air Quality Index (AQI)
-    df['air_quality'] = np.random.uniform(35, 65, len(dates))  # Good to Moderate range
+    seasonal = 5000 * np.sin(np.linspace(0, 4*np.pi, n, dtype=np.float32))  # Seasonal variation
+    energy = np.clip(base_energy + seasonal + normal(2000), 25000, None)
     
     # 5. Renewable Energy Mix (%)
     # Start low, gradually increasing
-    renewable_trend = np.linspace(0, 15, len(dates))
-    renewable_noise = np.random.uniform(-2, 2, len(dates))
-    df['energy_mix_renewable_pct'] = renewable_trend + renewable_noise
-    df['energy_mix_renewable_pct'] = df['energy_mix_renewable_pct'].clip(lower=0, upper=100)
-    
-    # 6. Waste Management (kg)
-    df['waste_generated'] = np.random.uniform(0, 100, len(dates))
-    df['waste_recycled_pct'] = np.random.uniform(60, 85, len(dates))
+    renewable_trend = np.linspace(0, 15, n, dtype=np.float32)
+    renewable = np.clip(renewable_trend + uniform(-2, 2), 0, 100)
     
     # 7. Carbon Offset (credits)
     # Quarterly purchases
-    df['carbon_offset_credits'] = 0
-    for i in range(0, len(dates), 90):  # Every 90 days
-        if i < len(dates):
-            df.loc[i, 'carbon_offset_credits'] = np.random.randint(50, 150)
-    df['trees_planted'] = np.random.poisson(5, len(dates))  # Average 5 trees per day
+    offsets = np.zeros(n, dtype=np.int64)
+    quarter_starts = np.arange(0, n, 90)  # Every 90 days
+    offsets[quarter_starts] = rng.integers(50, 150, len(quarter_starts))
+    
+    df = pd.DataFrame({
+        'date': dates.strftime('%Y-%m-%d'),
+        'timestamp': dates,
+        # 1. Travel Emissions (kg CO2e)
+        'travel_emissions': uniform(0, 50),  # Low due to remote work
+        'production_emissions': production,
+        'energy_consumption': energy,
+        # 4. Air Quality Index (AQI)
+        'air_quality': uniform(35, 65),  # Good to Moderate range
+        'energy_mix_renewable_pct': renewable,
+        # 6. Waste Management (kg)
+        'waste_generated': uniform(0, 100),
+        'waste_recycled_pct': uniform(60, 85),
+        'carbon_offset_credits': offsets,
+        'trees_planted': rng.poisson(5, n)  # Average 5 trees per day
+    })
     
     return df
 
@@ -77,15 +81,30 @@ def create_emissions_database():
     df = generate_historical_data()
     
     # Create database connection
-    conn = sqlite3.connect(DB_PATH)
+    conn = connect(DB_PATH)
+    # Write all tables in a single transaction
+    conn.execute("BEGIN")
     
     # Create main emissions table
-    df.to_sql('emissions', conn, if_exists='replace', index=False)
+    write_table(conn, df, 'emissions')
     
     print(f"✅ Created 'emissions' table with {len(df)} rows")
     print(f"   Date range: {df['date'].min()} to {df['date'].max()}")
     
     # Create summary statistics table
+    # Scan each column once for the summary instead of once per statistic
+    gauge_cols = [
+        'travel_emissions',
+        'production_emissions',
+        'energy_consumption',
+        'air_quality',
+        'energy_mix_renewable_pct',
+        'waste_generated'
+    ]
+    means = df[gauge_cols].mean()
+    latest = df[gauge_cols].iloc[-1]
+    totals = df[['carbon_offset_credits', 'trees_planted']].sum()
+    
     summary_data = {
         'metric': [
             'travel_emissions',
@@ -107,35 +126,20 @@ def create_emissions_database():
             'credits',
             'count'
         ],
-        'avg_value': [
-            df['travel_emissions'].mean(),
-            df['production_emissions'].mean(),
-            df['energy_consumption'].mean(),
-            df['air_quality'].mean(),
-            df['energy_mix_renewable_pct'].mean(),
-            df['waste_generated'].mean(),
-            df['carbon_offset_credits'].sum() / 4,  # Quarterly average
-            df['trees_planted'].sum()
+        'avg_value': means.tolist() + [
+            totals['carbon_offset_credits'] / 4,  # Quarterly average
+            totals['trees_planted']
         ],
-        'latest_value': [
-            df['travel_emissions'].iloc[-1],
-            df['production_emissions'].iloc[-1],
-            df['energy_consumption'].iloc[-1],
-            df['air_quality'].iloc[-1],
-            df['energy_mix_renewable_pct'].iloc[-1],
-            df['waste_generated'].iloc[-1],
-            df['carbon_offset_credits'].sum(),
-            df['trees_planted'].sum()
-        ]
+        'latest_value': latest.tolist() + totals.tolist()
     }
     
     summary_df = pd.DataFrame(summary_data)
-    summary_df.to_sql('emissions_summary', conn, if_exists='replace', index=False)
+    write_table(conn, summary_df, 'emissions_summary')
     
     print(f"✅ Created 'emissions_summary' table with {len(summary_df)} metrics")
     
     # Create monthly aggregates table for trend analysis
-    df['month'] = pd.to_datetime(df['timestamp']).dt.to_period('M').astype(str)
+    df['month'] = df['timestamp'].to_numpy().astype('datetime64[M]').astype(str)
     
     monthly = df.groupby('month').agg({
         'travel_emissions': 'sum',
@@ -148,10 +152,12 @@ def create_emissions_database():
         'trees_planted': 'sum'
     }).reset_index()
     
-    monthly.to_sql('emissions_monthly', conn, if_exists='replace', index=False)
+    write_table(conn, monthly, 'emissions_monthly')
     
     print(f"✅ Created 'emissions_monthly' table with {len(monthly)} months")
     
+    conn.commit()
+    
     # Verify data
     cursor = conn.cursor()
     cursor.execute("SELECT COUNT(*) FROM emissions")
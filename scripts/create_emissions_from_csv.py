@@ -2,10 +2,12 @@
 Create emissions_data.db with 7 tables from CSV files
 Each CSV file becomes a separate table
 """
-import sqlite3
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from sqlite_utils import connect, write_table
+
 # Database configuration
 DB_NAME = "emissions_data.db"
 DATASET_FOLDER = "dataset"
@@ -21,6 +23,11 @@ CSV_FILES = {
     "factory_air_quality_daily.csv": "air_quality"
 }
 
+def read_emissions_csv(csv_path):
+    """Read one emissions CSV with the multi-threaded Arrow parser"""
+    # Keep dates as text, which Arrow would otherwise convert to timestamps
+    return pd.read_csv(csv_path, engine='pyarrow', dtype={'date': str})
+
 def create_emissions_database():
     """Create emissions database from CSV files"""
     
@@ -28,9 +35,17 @@ def create_emissions_database():
     print("="*80)
     
     # Create database connection
-    conn = sqlite3.connect(DB_NAME)
+    conn = connect(DB_NAME)
+    # Write all tables in a single transaction
+    conn.execute("BEGIN")
     
-    # Load each CSV file into a table
+    # Source CSV mtimes from the last load, so unchanged tables are not rebuilt
+    conn.execute("CREATE TABLE IF NOT EXISTS _meta (table_name TEXT PRIMARY KEY, src_mtime INTEGER NOT NULL)")
+    loaded_mtimes = dict(conn.execute("SELECT table_name, src_mtime FROM _meta").fetchall())
+    existing_tables = {name for name, in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    
+    # Work out which CSV files need loading
+    pending = []
     for csv_file, table_name in CSV_FILES.items():
         csv_path = Path(DATASET_FOLDER) / csv_file
         
@@ -38,22 +53,38 @@ def create_emissions_database():
             print(f"⚠️  Warning: {csv_file} not found, skipping...")
             continue
         
-        print(f"\n📊 Loading {csv_file} → {table_name}")
-        
-        # Read CSV file
-        df = pd.read_csv(csv_path)
-        
-        print(f"   Rows: {len(df):,}")
-        print(f"   Columns: {', '.join(df.columns.tolist())}")
+        src_mtime = csv_path.stat().st_mtime_ns
+        if table_name in existing_tables and loaded_mtimes.get(table_name) == src_mtime:
+            print(f"\n⏭️  {table_name} is up to date, skipping {csv_file}")
+            continue
         
-        # Write to SQLite table
-        df.to_sql(table_name, conn, if_exists='replace', index=False)
+        pending.append((csv_file, csv_path, table_name, src_mtime))
+    
+    # Parse the CSVs in parallel (parsing releases the GIL); SQLite writes
+    # stay on this thread as each file finishes
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {pool.submit(read_emissions_csv, csv_path): (csv_file, table_name, src_mtime)
+                   for csv_file, csv_path, table_name, src_mtime in pending}
         
-        print(f"   ✅ Table '{table_name}' created successfully")
+        for future in as_completed(futures):
+            csv_file, table_name, src_mtime = futures[future]
+            df = future.result()
+            
+            print(f"\n📊 Loading {csv_file} → {table_name}")
+            print(f"   Rows: {len(df):,}")
+            print(f"   Columns: {', '.join(df.columns.tolist())}")
+            
+            # Write to SQLite table
+            write_table(conn, df, table_name)
+            conn.execute("INSERT OR REPLACE INTO _meta (table_name, src_mtime) VALUES (?, ?)", (table_name, src_mtime))
+            
+            print(f"   ✅ Table '{table_name}' created successfully")
+    
+    conn.commit()
     
     # Verify all tables
     cursor = conn.cursor()
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE '\\_%' ESCAPE '\\' ORDER BY name")
     tables = cursor.fetchall()
     
     print("\n" + "="*80)
@@ -61,10 +92,13 @@ def create_emissions_database():
     print(f"Total tables: {len(tables)}")
     print("\nTables in database:")
     
-    for table_name, in tables:
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        row_count = cursor.fetchone()[0]
-        print(f"  - {table_name}: {row_count:,} rows")
+    # Count every table in one round trip
+    if tables:
+        cursor.execute(" UNION ALL ".join(
+            f"SELECT '{table_name}', COUNT(*) FROM \"{table_name}\"" for table_name, in tables
+        ))
+        for table_name, row_count in cursor.fetchall():
+            print(f"  - {table_name}: {row_count:,} rows")
     
     conn.close()
     print("\n" + "="*80)
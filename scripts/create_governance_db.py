@@ -3,60 +3,59 @@ Create SQLite database from governance CSV files
 Converts all governance datasets into a single governance_metrics.db
 """
 
-import sqlite3
-import pandas as pd
 import os
 
+from sqlite_utils import connect, csv_fingerprint, finish_build, import_csv, index_time_columns, read_fingerprint, write_fingerprint
+
 # Input directory
 INPUT_DIR = 'governance_dataset'
 OUTPUT_DB = 'governance_metrics.db'
 
-def create_database():
+# CSV files to import
+CSV_FILES = {
+    'board_composition': 'board_composition_quarterly.csv',
+    'compliance_metrics': 'compliance_metrics_quarterly.csv',
+    'esg_ratings': 'esg_ratings_quarterly.csv',
+    'transparency_disclosure': 'transparency_disclosure_quarterly.csv'
+}
+
+def create_database(conn, fingerprint):
     """
     Create SQLite database from governance CSV files
-    """
     
-    # Remove existing database if it exists
-    if os.path.exists(OUTPUT_DB):
-        os.remove(OUTPUT_DB)
-        print(f"🗑️  Removed existing {OUTPUT_DB}")
-    
-    # Connect to SQLite database (creates if doesn't exist)
-    conn = sqlite3.connect(OUTPUT_DB)
-    print(f"✅ Created new database: {OUTPUT_DB}")
+    Args:
+        conn: Connection opened by main() with connect(OUTPUT_DB, fresh=True)
+        fingerprint: csv_fingerprint() of the input files, stored with the tables
+    """
     
-    # CSV files to import
-    csv_files = {
-        'board_composition': 'board_composition_quarterly.csv',
-        'compliance_metrics': 'compliance_metrics_quarterly.csv',
-        'esg_ratings': 'esg_ratings_quarterly.csv',
-        'transparency_disclosure': 'transparency_disclosure_quarterly.csv'
-    }
+    # Write all tables in a single transaction
+    conn.execute("BEGIN")
     
     tables_created = []
     
-    for table_name, csv_file in csv_files.items():
+    for table_name, csv_file in CSV_FILES.items():
         csv_path = os.path.join(INPUT_DIR, csv_file)
         
         if not os.path.exists(csv_path):
             print(f"⚠️  Warning: {csv_path} not found, skipping...")
             continue
         
-        # Read CSV
-        df = pd.read_csv(csv_path)
+        # Copy CSV rows straight into SQLite
+        row_count = import_csv(conn, csv_path, table_name)
+        index_time_columns(conn, table_name)
         
-        # Write to SQLite
-        df.to_sql(table_name, conn, if_exists='replace', index=False)
-        
-        print(f"✅ Imported: {csv_file} → {table_name} table ({len(df)} rows)")
-        tables_created.append((table_name, len(df)))
+        print(f"✅ Imported: {csv_file} → {table_name} table ({row_count} rows)")
+        tables_created.append((table_name, row_count))
     
-    # Close connection
-    conn.close()
+    # Planner statistics for the new indexes
+    conn.execute("ANALYZE")
+    write_fingerprint(conn, fingerprint)
+    conn.commit()
+    finish_build(conn)
     
     return tables_created
 
-def verify_database(tables_created):
+def verify_database(conn, tables_created):
     """
     Verify the database was created correctly
     """
@@ -69,28 +68,36 @@ def verify_database(tables_created):
     db_size = os.path.getsize(OUTPUT_DB) / 1024  # KB
     print(f"Database size: {db_size:.2f} KB")
     
-    # Connect and verify tables
-    conn = sqlite3.connect(OUTPUT_DB)
+    # Verify tables
     cursor = conn.cursor()
     
     print(f"\nTables created: {len(tables_created)}")
     
+    # Count every table in one round trip, and list all columns in another
+    counts = {}
+    columns = {}
+    if tables_created:
+        cursor.execute(" UNION ALL ".join(
+            f"SELECT '{table_name}', COUNT(*) FROM \"{table_name}\"" for table_name, _ in tables_created
+        ))
+        counts = dict(cursor.fetchall())
+        cursor.execute("""
+            SELECT m.name, p.name FROM sqlite_master m, pragma_table_info(m.name) p
+            WHERE m.type = 'table' ORDER BY m.name, p.cid
+        """)
+        for table_name, column in cursor.fetchall():
+            columns.setdefault(table_name, []).append(column)
+    
     for table_name, expected_rows in tables_created:
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        actual_rows = cursor.fetchone()[0]
+        actual_rows = counts[table_name]
         
         status = "✅" if actual_rows == expected_rows else "❌"
         print(f"  {status} {table_name}: {actual_rows} rows")
         
-        # Show sample data
-        cursor.execute(f"SELECT * FROM {table_name} LIMIT 1")
-        sample = cursor.fetchone()
-        if sample:
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = [col[1] for col in cursor.fetchall()]
-            print(f"     Columns: {', '.join(columns[:5])}{'...' if len(columns) > 5 else ''}")
-    
-    conn.close()
+        # Show columns of tables that have data
+        if actual_rows:
+            table_columns = columns[table_name]
+            print(f"     Columns: {', '.join(table_columns[:5])}{'...' if len(table_columns) > 5 else ''}")
     
     print("\n" + "="*60)
     print("✅ DATABASE CREATED SUCCESSFULLY!")
@@ -107,11 +114,26 @@ def main():
     print("="*60)
     print()
     
-    # Create database
-    tables_created = create_database()
+    # Skip the rebuild when the CSVs are byte-for-byte what the database was built from
+    csv_paths = [os.path.join(INPUT_DIR, csv_file) for csv_file in CSV_FILES.values()]
+    fingerprint = csv_fingerprint([path for path in csv_paths if os.path.exists(path)])
+    if read_fingerprint(OUTPUT_DB) == fingerprint:
+        print(f"⏭️  {OUTPUT_DB} is up to date with {INPUT_DIR}/, skipping rebuild")
+        return
     
-    # Verify database
-    verify_database(tables_created)
+    # One connection for building and verifying the database; fresh=True
+    # removes any existing database and its WAL files first
+    conn = connect(OUTPUT_DB, fresh=True)
+    print(f"✅ Created new database: {OUTPUT_DB}")
+    
+    try:
+        # Create database
+        tables_created = create_database(conn, fingerprint)
+        
+        # Verify database
+        verify_database(conn, tables_created)
+    finally:
+        conn.close()
 
 if __name__ == "__main__":
     main()
@@ -1,14 +1,22 @@
 """
 Convert Social CSV datasets to SQLite database
 """
-import pandas as pd
-import sqlite3
 from pathlib import Path
 
+from sqlite_utils import connect, csv_fingerprint, finish_build, import_csv, index_time_columns, read_fingerprint, write_fingerprint
+
 # Paths
 CSV_DIR = Path("social_dataset")
 DB_PATH = Path("social_metrics.db")
 
+# CSV files to import
+CSV_FILES = {
+    "employee_wellbeing": "employee_wellbeing_monthly.csv",
+    "diversity_inclusion": "diversity_inclusion_quarterly.csv",
+    "community_impact": "community_impact_quarterly.csv",
+    "health_safety": "health_safety_monthly.csv"
+}
+
 def create_database():
     """Create SQLite database from CSV files"""
     print("📦 Creating SQLite database for social metrics...")
@@ -16,58 +24,59 @@ def create_database():
     print(f"💾 Database: {DB_PATH.absolute()}")
     print("=" * 60)
     
-    # Remove old database if exists
-    if DB_PATH.exists():
-        DB_PATH.unlink()
-        print("🗑️  Removed old database")
+    # Skip the rebuild when the CSVs are byte-for-byte what the database was built from
+    csv_paths = [CSV_DIR / csv_file for csv_file in CSV_FILES.values()]
+    fingerprint = csv_fingerprint([path for path in csv_paths if path.exists()])
+    if read_fingerprint(DB_PATH) == fingerprint:
+        print("⏭️  Database is up to date with the CSV files, skipping rebuild")
+        return
     
-    # Create connection
-    conn = sqlite3.connect(DB_PATH)
+    # Create connection; fresh=True removes any old database and its WAL files first
+    conn = connect(DB_PATH, fresh=True)
+    # Write all tables in a single transaction
+    conn.execute("BEGIN")
     
     # Load and store each CSV
-    csv_files = {
-        "employee_wellbeing": "employee_wellbeing_monthly.csv",
-        "diversity_inclusion": "diversity_inclusion_quarterly.csv",
-        "community_impact": "community_impact_quarterly.csv",
-        "health_safety": "health_safety_monthly.csv"
-    }
-    
-    for table_name, csv_file in csv_files.items():
+    for table_name, csv_file in CSV_FILES.items():
         csv_path = CSV_DIR / csv_file
         if csv_path.exists():
-            df = pd.read_csv(csv_path)
-            df.to_sql(table_name, conn, if_exists='replace', index=False)
-            print(f"✅ {table_name}: {len(df)} rows loaded")
+            row_count = import_csv(conn, csv_path, table_name)
+            index_time_columns(conn, table_name)
+            print(f"✅ {table_name}: {row_count} rows loaded")
         else:
             print(f"⚠️  {csv_file} not found")
     
-    conn.close()
+    # Planner statistics for the new indexes
+    conn.execute("ANALYZE")
+    write_fingerprint(conn, fingerprint)
+    conn.commit()
+    finish_build(conn)
     
     print("=" * 60)
     print(f"✅ Database created successfully!")
     print(f"💾 File size: {DB_PATH.stat().st_size / 1024:.2f} KB")
     
-    # Verify database
-    verify_database()
+    # Verify database on the same connection
+    verify_database(conn)
+    conn.close()
 
-def verify_database():
+def verify_database(conn):
     """Verify database contents"""
     print("\n🔍 Verifying database contents...")
-    conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     
-    # Get all tables
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+    # Get all data tables (skipping build metadata and sqlite_stat1)
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE '\\_%' ESCAPE '\\' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\';")
     tables = cursor.fetchall()
     
     print(f"📊 Tables found: {len(tables)}")
-    for table in tables:
-        table_name = table[0]
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        count = cursor.fetchone()[0]
-        print(f"   - {table_name}: {count} rows")
-    
-    conn.close()
+    # Count every table in one round trip
+    if tables:
+        cursor.execute(" UNION ALL ".join(
+            f"SELECT '{table_name}', COUNT(*) FROM \"{table_name}\"" for table_name, in tables
+        ))
+        for table_name, count in cursor.fetchall():
+            print(f"   - {table_name}: {count} rows")
 
 if __name__ == "__main__":
     create_database()
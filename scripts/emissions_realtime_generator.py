@@ -2,7 +2,7 @@
 Real-time Emissions Data Generator
 Generates all 7 emissions-related metrics continuously
 """
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from datetime import datetime, timedelta
 import time
@@ -10,214 +10,174 @@ import os
 from pathlib import Path
 import json
 
+from realtime_utils import append_row
+
 # Output directory
 OUTPUT_DIR = Path("dataset_realtime/emissions")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-def generate_travel_emissions():
+# Seconds between ticks
+REFRESH_INTERVAL = 60
+
+# Threads writing the metric files; each file is only touched by one task per tick
+IO_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Random source and (low, high) bounds for each metric's random fields
+rng = np.random.default_rng()
+TRAVEL_BOUNDS = (
+    np.array([5000, 2000, 800, 150]),
+    np.array([15000, 8000, 2400, 600])
+)
+PRODUCTION_BOUNDS = (
+    np.array([8000, 3000, 1500, 4500]),
+    np.array([12000, 5000, 2500, 7500])
+)
+ENERGY_CONSUMPTION_BOUNDS = (
+    np.array([15000, 8000, 5000, 28000]),
+    np.array([25000, 12000, 10000, 47000])
+)
+WATER_USAGE_BOUNDS = (
+    np.array([50000, 30000, 5000, 20000, 85000]),
+    np.array([80000, 50000, 10000, 35000, 140000])
+)
+AIR_QUALITY_BOUNDS = (
+    np.array([10, 20, 15, 5, 0.5, 30]),
+    np.array([50, 80, 45, 20, 2.0, 90])
+)
+ENERGY_MIX_BOUNDS = (
+    np.array([25, 20, 10]),
+    np.array([35, 30, 15])
+)
+WASTE_BOUNDS = (
+    np.array([15000, 5000, 8000, 500]),
+    np.array([25000, 10000, 15000, 2000])
+)
+
+# All bounds concatenated so one rng.uniform call per tick draws every metric,
+# and the slice of that draw belonging to each metric
+METRIC_BOUNDS = {
+    "travel_emissions": TRAVEL_BOUNDS,
+    "production_emissions": PRODUCTION_BOUNDS,
+    "energy_consumption": ENERGY_CONSUMPTION_BOUNDS,
+    "water_usage": WATER_USAGE_BOUNDS,
+    "air_quality": AIR_QUALITY_BOUNDS,
+    "energy_mix": ENERGY_MIX_BOUNDS,
+    "waste_management": WASTE_BOUNDS
+}
+ALL_LOW = np.concatenate([low for low, _ in METRIC_BOUNDS.values()])
+ALL_HIGH = np.concatenate([high for _, high in METRIC_BOUNDS.values()])
+SLICES = {}
+_offset = 0
+for _name, (_low, _) in METRIC_BOUNDS.items():
+    SLICES[_name] = slice(_offset, _offset + len(_low))
+    _offset += len(_low)
+
+def generate_travel_emissions(date, values):
     """Generate daily company travel emissions"""
-    today = datetime.now()
-    date = today.strftime("%Y-%m-%d")
-    
-    data = {
-        "date": [date],
-        "air_travel_km": [np.random.uniform(5000, 15000)],
-        "ground_transport_km": [np.random.uniform(2000, 8000)],
-        "air_emissions_kg": [np.random.uniform(800, 2400)],
-        "ground_emissions_kg": [np.random.uniform(150, 600)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "company_travel_emissions_daily.csv"
-    
-    # Append if file exists, otherwise create new
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        df = pd.concat([existing, df], ignore_index=True)
-        # Keep only last 30 days
-        df = df.tail(30)
+    header = ["date", "air_travel_km", "ground_transport_km", "air_emissions_kg", "ground_emissions_kg"]
+    row = [date] + values
     
-    df.to_csv(output_file, index=False)
-    return len(df)
+    output_file = OUTPUT_DIR / "company_travel_emissions_daily.parquet"
+    # Keep only last 30 rows
+    return append_row(output_file, header, row, max_rows=30)
 
-def generate_production_emissions():
+def generate_production_emissions(date, values):
     """Generate daily production emissions"""
-    today = datetime.now()
-    date = today.strftime("%Y-%m-%d")
+    header = ["date", "production_volume_units", "direct_emissions_kg", "indirect_emissions_kg", "total_emissions_kg"]
+    row = [date] + values
     
-    data = {
-        "date": [date],
-        "production_volume_units": [np.random.uniform(8000, 12000)],
-        "direct_emissions_kg": [np.random.uniform(3000, 5000)],
-        "indirect_emissions_kg": [np.random.uniform(1500, 2500)],
-        "total_emissions_kg": [np.random.uniform(4500, 7500)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "production_emissions_daily.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(30)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+    output_file = OUTPUT_DIR / "production_emissions_daily.parquet"
+    # Keep only last 30 rows
+    return append_row(output_file, header, row, max_rows=30)
 
-def generate_energy_consumption():
+def generate_energy_consumption(date, values):
     """Generate daily energy consumption"""
-    today = datetime.now()
-    date = today.strftime("%Y-%m-%d")
+    header = ["date", "electricity_kwh", "natural_gas_kwh", "renewable_kwh", "total_kwh"]
+    row = [date] + values
     
-    data = {
-        "date": [date],
-        "electricity_kwh": [np.random.uniform(15000, 25000)],
-        "natural_gas_kwh": [np.random.uniform(8000, 12000)],
-        "renewable_kwh": [np.random.uniform(5000, 10000)],
-        "total_kwh": [np.random.uniform(28000, 47000)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "energy_consumption_daily.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(30)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+    output_file = OUTPUT_DIR / "energy_consumption_daily.parquet"
+    # Keep only last 30 rows
+    return append_row(output_file, header, row, max_rows=30)
 
-def generate_water_usage():
+def generate_water_usage(date, values):
     """Generate daily water usage"""
-    today = datetime.now()
-    date = today.strftime("%Y-%m-%d")
-    
-    data = {
-        "date": [date],
-        "process_water_liters": [np.random.uniform(50000, 80000)],
-        "cooling_water_liters": [np.random.uniform(30000, 50000)],
-        "domestic_water_liters": [np.random.uniform(5000, 10000)],
-        "recycled_water_liters": [np.random.uniform(20000, 35000)],
-        "total_consumption_liters": [np.random.uniform(85000, 140000)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "water_usage_daily.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(30)
+    header = ["date", "process_water_liters", "cooling_water_liters", "domestic_water_liters", "recycled_water_liters", "total_consumption_liters"]
+    row = [date] + values
     
-    df.to_csv(output_file, index=False)
-    return len(df)
+    output_file = OUTPUT_DIR / "water_usage_daily.parquet"
+    # Keep only last 30 rows
+    return append_row(output_file, header, row, max_rows=30)
 
-def generate_air_quality():
+def generate_air_quality(date, values):
     """Generate daily air quality monitoring"""
-    today = datetime.now()
-    date = today.strftime("%Y-%m-%d")
-    
-    data = {
-        "date": [date],
-        "pm25_ug_m3": [np.random.uniform(10, 50)],
-        "pm10_ug_m3": [np.random.uniform(20, 80)],
-        "no2_ppb": [np.random.uniform(15, 45)],
-        "so2_ppb": [np.random.uniform(5, 20)],
-        "co_ppm": [np.random.uniform(0.5, 2.0)],
-        "aqi_score": [np.random.uniform(30, 90)]
-    }
+    header = ["date", "pm25_ug_m3", "pm10_ug_m3", "no2_ppb", "so2_ppb", "co_ppm", "aqi_score"]
+    row = [date] + values
     
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "air_quality_monitoring_daily.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(30)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+    output_file = OUTPUT_DIR / "air_quality_monitoring_daily.parquet"
+    # Keep only last 30 rows
+    return append_row(output_file, header, row, max_rows=30)
 
-def generate_energy_mix():
+def generate_energy_mix(month, values):
     """Generate monthly energy mix"""
-    today = datetime.now()
-    month = today.strftime("%Y-%m")
-    
     # Generate mix that sums to 100%
-    solar = np.random.uniform(25, 35)
-    wind = np.random.uniform(20, 30)
-    hydro = np.random.uniform(10, 15)
+    solar, wind, hydro = values
     fossil = 100 - solar - wind - hydro
     
-    data = {
-        "month": [month],
-        "solar_percent": [solar],
-        "wind_percent": [wind],
-        "hydro_percent": [hydro],
-        "fossil_percent": [fossil],
-        "renewable_total_percent": [solar + wind + hydro]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "energy_mix_monthly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        # Check if this month already exists
-        if month in existing['month'].values:
-            existing = existing[existing['month'] != month]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(12)  # Keep last 12 months
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+    header = ["month", "solar_percent", "wind_percent", "hydro_percent", "fossil_percent", "renewable_total_percent"]
+    row = [
+        month,
+        solar,
+        wind,
+        hydro,
+        fossil,
+        solar + wind + hydro
+    ]
+    
+    output_file = OUTPUT_DIR / "energy_mix_monthly.parquet"
+    # Keep last 12 months, one row per month
+    return append_row(output_file, header, row, max_rows=12, replace_key=True)
 
-def generate_waste_management():
+def generate_waste_management(month, values):
     """Generate monthly waste management"""
-    today = datetime.now()
-    month = today.strftime("%Y-%m")
-    
-    recycled = np.random.uniform(15000, 25000)
-    composted = np.random.uniform(5000, 10000)
-    landfill = np.random.uniform(8000, 15000)
-    hazardous = np.random.uniform(500, 2000)
+    recycled, composted, landfill, hazardous = values
     total = recycled + composted + landfill + hazardous
     
-    data = {
-        "month": [month],
-        "recycled_kg": [recycled],
-        "composted_kg": [composted],
-        "landfill_kg": [landfill],
-        "hazardous_waste_kg": [hazardous],
-        "total_waste_kg": [total],
-        "recycling_rate_percent": [(recycled / total) * 100]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "waste_management_monthly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        if month in existing['month'].values:
-            existing = existing[existing['month'] != month]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(12)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+    header = ["month", "recycled_kg", "composted_kg", "landfill_kg", "hazardous_waste_kg", "total_waste_kg", "recycling_rate_percent"]
+    row = [
+        month,
+        recycled,
+        composted,
+        landfill,
+        hazardous,
+        total,
+        (recycled / total) * 100
+    ]
+    
+    output_file = OUTPUT_DIR / "waste_management_monthly.parquet"
+    # Keep last 12 months, one row per month
+    return append_row(output_file, header, row, max_rows=12, replace_key=True)
 
 def generate_all_emissions():
     """Generate all 7 emissions metrics"""
-    metrics = {
-        "travel_emissions": generate_travel_emissions(),
-        "production_emissions": generate_production_emissions(),
-        "energy_consumption": generate_energy_consumption(),
-        "water_usage": generate_water_usage(),
-        "air_quality": generate_air_quality(),
-        "energy_mix": generate_energy_mix(),
-        "waste_management": generate_waste_management()
+    # One clock read per tick, shared by every metric
+    date = datetime.now().strftime("%Y-%m-%d")
+    month = date[:7]
+    
+    # Draw the random fields of every metric at once
+    values = rng.uniform(ALL_LOW, ALL_HIGH).tolist()
+    draws = {name: values[part] for name, part in SLICES.items()}
+    
+    # Write the seven files concurrently
+    futures = {
+        "travel_emissions": IO_POOL.submit(generate_travel_emissions, date, draws["travel_emissions"]),
+        "production_emissions": IO_POOL.submit(generate_production_emissions, date, draws["production_emissions"]),
+        "energy_consumption": IO_POOL.submit(generate_energy_consumption, date, draws["energy_consumption"]),
+        "water_usage": IO_POOL.submit(generate_water_usage, date, draws["water_usage"]),
+        "air_quality": IO_POOL.submit(generate_air_quality, date, draws["air_quality"]),
+        "energy_mix": IO_POOL.submit(generate_energy_mix, month, draws["energy_mix"]),
+        "waste_management": IO_POOL.submit(generate_waste_management, month, draws["waste_management"])
     }
+    metrics = {name: future.result() for name, future in futures.items()}
     
     timestamp = datetime.now().isoformat()
     print(f"[{timestamp}] Generated emissions metrics: {json.dumps(metrics, indent=2)}")
@@ -228,10 +188,13 @@ def main():
     """Main loop - generate data every 60 seconds"""
     print("🌱 Emissions Real-time Generator Started")
     print(f"📁 Output directory: {OUTPUT_DIR.absolute()}")
-    print("⏱️  Refresh interval: 60 seconds")
+    print(f"⏱️  Refresh interval: {REFRESH_INTERVAL} seconds")
     print("-" * 60)
     
     iteration = 0
+    # Ticks are scheduled on a fixed monotonic grid so the time spent
+    # generating does not push every later tick back
+    next_deadline = time.monotonic()
     while True:
         iteration += 1
         print(f"\n🔄 Iteration #{iteration}")
@@ -242,8 +205,15 @@ def main():
         except Exception as e:
             print(f"❌ Error generating data: {e}")
         
-        print(f"⏳ Sleeping for 60 seconds...")
-        time.sleep(60)
+        next_deadline += REFRESH_INTERVAL
+        remaining = next_deadline - time.monotonic()
+        if remaining < 0:
+            print(f"⚠️  Tick overran the interval by {-remaining:.1f}s, starting the next one now")
+            next_deadline = time.monotonic()
+            remaining = 0
+        
+        print(f"⏳ Sleeping for {remaining:.1f} seconds...")
+        time.sleep(remaining)
 
 if __name__ == "__main__":
     main()
@@ -16,36 +16,43 @@ import os
 OUTPUT_DIR = 'governance_dataset'
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Number of quarterly snapshots (1 year + current quarter)
+N_QUARTERS = 5
+
+def quarter_labels(start_date):
+    """Labels like 'Q1 2024' for N_QUARTERS quarters spaced 90 days apart from start_date"""
+    labels = []
+    for i in range(N_QUARTERS):
+        quarter_date = start_date + timedelta(days=90*i)
+        labels.append(f"Q{((quarter_date.month-1)//3)+1} {quarter_date.year}")
+    return labels
+
+# Shared by all four datasets, starting from 1 year ago
+QUARTER_LABELS = quarter_labels(datetime.now() - timedelta(days=365))
+
 def generate_board_composition():
     """
     Generate board composition data - quarterly snapshots for 1 year
     Tracks board diversity and independence
     """
     
-    # Starting from 1 year ago
-    start_date = datetime.now() - timedelta(days=365)
+    # Generate quarterly data (5 quarters to show full year), one array per column
+    i = np.arange(N_QUARTERS)
+    independent = 4 + (i // 2)  # Gradually increasing
+    female = 2 + (i // 3)  # Gradually increasing
     
-    # Generate quarterly data (5 quarters to show full year)
-    quarters = []
-    for i in range(5):
-        quarter_date = start_date + timedelta(days=90*i)
-        quarter_label = f"Q{((quarter_date.month-1)//3)+1} {quarter_date.year}"
-        
-        # Progressive improvement in diversity
-        data = {
-            'quarter': quarter_label,
-            'total_directors': 7,
-            'independent_directors': 4 + (i // 2),  # Gradually increasing
-            'female_directors': 2 + (i // 3),  # Gradually increasing
-            'independent_percent': round((4 + (i // 2)) / 7 * 100, 1),
-            'female_percent': round((2 + (i // 3)) / 7 * 100, 1),
-            'average_tenure_years': round(3.5 + (i * 0.2), 1),
-            'board_meetings_held': 4,
-            'average_attendance_percent': round(92 + np.random.uniform(-2, 5), 1)
-        }
-        quarters.append(data)
-    
-    df = pd.DataFrame(quarters)
+    # Progressive improvement in diversity
+    df = pd.DataFrame({
+        'quarter': QUARTER_LABELS,
+        'total_directors': np.full(N_QUARTERS, 7),
+        'independent_directors': independent,
+        'female_directors': female,
+        'independent_percent': np.round(independent / 7 * 100, 1),
+        'female_percent': np.round(female / 7 * 100, 1),
+        'average_tenure_years': np.round(3.5 + (i * 0.2), 1),
+        'board_meetings_held': np.full(N_QUARTERS, 4),
+        'average_attendance_percent': np.round(92 + np.random.uniform(-2, 5, size=N_QUARTERS), 1)
+    })
     
     # Save to CSV
     output_path = os.path.join(OUTPUT_DIR, 'board_composition_quarterly.csv')
@@ -63,32 +70,23 @@ def generate_compliance_metrics():
     Tracks ESG audit performance and regulatory compliance
     """
     
-    start_date = datetime.now() - timedelta(days=365)
+    i = np.arange(N_QUARTERS)
     
-    quarters = []
-    for i in range(5):
-        quarter_date = start_date + timedelta(days=90*i)
-        quarter_label = f"Q{((quarter_date.month-1)//3)+1} {quarter_date.year}"
-        
-        # Progressive improvement in compliance
-        data = {
-            'quarter': quarter_label,
-            'esg_audits_conducted': np.random.randint(2, 4),
-            'audits_passed': 2 + (i // 2),  # Improving over time
-            'compliance_rate_percent': round(75 + (i * 4) + np.random.uniform(-2, 2), 1),
-            'regulatory_violations': max(0, 3 - i),  # Decreasing over time
-            'corrective_actions_completed': np.random.randint(4, 8),
-            'policy_updates': np.random.randint(2, 5),
-            'employee_ethics_training_percent': round(85 + (i * 2) + np.random.uniform(-1, 2), 1),
-            'whistleblower_reports': np.random.randint(0, 2)
-        }
-        
-        # Ensure compliance rate doesn't exceed 100%
-        data['compliance_rate_percent'] = min(98.5, data['compliance_rate_percent'])
-        
-        quarters.append(data)
+    # Progressive improvement in compliance
+    compliance_rate = np.round(75 + (i * 4) + np.random.uniform(-2, 2, size=N_QUARTERS), 1)
     
-    df = pd.DataFrame(quarters)
+    df = pd.DataFrame({
+        'quarter': QUARTER_LABELS,
+        'esg_audits_conducted': np.random.randint(2, 4, size=N_QUARTERS),
+        'audits_passed': 2 + (i // 2),  # Improving over time
+        # Ensure compliance rate doesn't exceed 100%
+        'compliance_rate_percent': np.minimum(98.5, compliance_rate),
+        'regulatory_violations': np.maximum(0, 3 - i),  # Decreasing over time
+        'corrective_actions_completed': np.random.randint(4, 8, size=N_QUARTERS),
+        'policy_updates': np.random.randint(2, 5, size=N_QUARTERS),
+        'employee_ethics_training_percent': np.round(85 + (i * 2) + np.random.uniform(-1, 2, size=N_QUARTERS), 1),
+        'whistleblower_reports': np.random.randint(0, 2, size=N_QUARTERS)
+    })
     
     output_path = os.path.join(OUTPUT_DIR, 'compliance_metrics_quarterly.csv')
     df.to_csv(output_path, index=False)
@@ -105,37 +103,28 @@ def generate_esg_ratings():
     Simulates ratings from major ESG rating agencies
     """
     
-    start_date = datetime.now() - timedelta(days=365)
+    i = np.arange(N_QUARTERS)
     
-    quarters = []
-    for i in range(5):
-        quarter_date = start_date + timedelta(days=90*i)
-        quarter_label = f"Q{((quarter_date.month-1)//3)+1} {quarter_date.year}"
-        
-        # Progressive improvement in ratings
-        base_score = 65 + (i * 3)
-        
-        data = {
-            'quarter': quarter_label,
-            # Overall ESG Score (0-100)
-            'overall_esg_score': round(base_score + np.random.uniform(-2, 3), 1),
-            # Letter grade (A, B, C, etc.)
-            'esg_grade': 'B' if base_score < 70 else ('B+' if base_score < 75 else 'A-'),
-            # Component scores
-            'environmental_score': round(base_score + np.random.uniform(-3, 5), 1),
-            'social_score': round(base_score + np.random.uniform(-5, 2), 1),
-            'governance_score': round(base_score + np.random.uniform(-2, 4), 1),
-            # Risk rating (Low, Medium, High)
-            'esg_risk_rating': 'Medium' if base_score < 70 else 'Low',
-            # Percentile rank vs peers
-            'industry_percentile_rank': round(50 + (i * 5) + np.random.uniform(-3, 5), 1),
-            # Carbon disclosure score (CDP-style A to D)
-            'carbon_disclosure_score': 'B' if i < 2 else ('B+' if i < 4 else 'A-')
-        }
-        
-        quarters.append(data)
+    # Progressive improvement in ratings
+    base_score = 65 + (i * 3)
     
-    df = pd.DataFrame(quarters)
+    df = pd.DataFrame({
+        'quarter': QUARTER_LABELS,
+        # Overall ESG Score (0-100)
+        'overall_esg_score': np.round(base_score + np.random.uniform(-2, 3, size=N_QUARTERS), 1),
+        # Letter grade (A, B, C, etc.)
+        'esg_grade': np.where(base_score < 70, 'B', np.where(base_score < 75, 'B+', 'A-')),
+        # Component scores
+        'environmental_score': np.round(base_score + np.random.uniform(-3, 5, size=N_QUARTERS), 1),
+        'social_score': np.round(base_score + np.random.uniform(-5, 2, size=N_QUARTERS), 1),
+        'governance_score': np.round(base_score + np.random.uniform(-2, 4, size=N_QUARTERS), 1),
+        # Risk rating (Low, Medium, High)
+        'esg_risk_rating': np.where(base_score < 70, 'Medium', 'Low'),
+        # Percentile rank vs peers
+        'industry_percentile_rank': np.round(50 + (i * 5) + np.random.uniform(-3, 5, size=N_QUARTERS), 1),
+        # Carbon disclosure score (CDP-style A to D)
+        'carbon_disclosure_score': np.where(i < 2, 'B', np.where(i < 4, 'B+', 'A-'))
+    })
     
     output_path = os.path.join(OUTPUT_DIR, 'esg_ratings_quarterly.csv')
     df.to_csv(output_path, index=False)
@@ -152,35 +141,26 @@ def generate_transparency_disclosure():
     Tracks data disclosure completeness and verification status
     """
     
-    start_date = datetime.now() - timedelta(days=365)
+    i = np.arange(N_QUARTERS)
     
-    quarters = []
-    for i in range(5):
-        quarter_date = start_date + timedelta(days=90*i)
-        quarter_label = f"Q{((quarter_date.month-1)//3)+1} {quarter_date.year}"
-        
-        # Progressive improvement in transparency
-        data = {
-            'quarter': quarter_label,
-            'data_disclosure_completeness_percent': round(75 + (i * 4) + np.random.uniform(-1, 3), 1),
-            'esg_report_published': 'Yes' if i >= 2 else 'In Progress',
-            'third_party_verified_metrics': 8 + i,  # Increasing verification
-            'total_reportable_metrics': 15,
-            'verification_percent': round((8 + i) / 15 * 100, 1),
-            'public_commitments_tracked': 5 + i,
-            'commitments_on_track_percent': round(80 + (i * 3) + np.random.uniform(-2, 4), 1),
-            'stakeholder_engagement_events': np.random.randint(3, 7),
-            'sustainability_website_updates': np.random.randint(4, 9),
-            'regulatory_filings_submitted': np.random.randint(3, 6)
-        }
-        
-        # Ensure percentages don't exceed 100%
-        data['data_disclosure_completeness_percent'] = min(95.0, data['data_disclosure_completeness_percent'])
-        data['commitments_on_track_percent'] = min(98.0, data['commitments_on_track_percent'])
-        
-        quarters.append(data)
+    # Progressive improvement in transparency
+    completeness = np.round(75 + (i * 4) + np.random.uniform(-1, 3, size=N_QUARTERS), 1)
+    on_track = np.round(80 + (i * 3) + np.random.uniform(-2, 4, size=N_QUARTERS), 1)
     
-    df = pd.DataFrame(quarters)
+    df = pd.DataFrame({
+        'quarter': QUARTER_LABELS,
+        # Ensure percentages don't exceed 100%
+        'data_disclosure_completeness_percent': np.minimum(95.0, completeness),
+        'esg_report_published': np.where(i >= 2, 'Yes', 'In Progress'),
+        'third_party_verified_metrics': 8 + i,  # Increasing verification
+        'total_reportable_metrics': np.full(N_QUARTERS, 15),
+        'verification_percent': np.round((8 + i) / 15 * 100, 1),
+        'public_commitments_tracked': 5 + i,
+        'commitments_on_track_percent': np.minimum(98.0, on_track),
+        'stakeholder_engagement_events': np.random.randint(3, 7, size=N_QUARTERS),
+        'sustainability_website_updates': np.random.randint(4, 9, size=N_QUARTERS),
+        'regulatory_filings_submitted': np.random.randint(3, 6, size=N_QUARTERS)
+    })
     
     output_path = os.path.join(OUTPUT_DIR, 'transparency_disclosure_quarterly.csv')
     df.to_csv(output_path, index=False)
@@ -191,14 +171,10 @@ def generate_transparency_disclosure():
     
     return df
 
-def generate_summary_report(board_df, compliance_df, ratings_df, transparency_df):
-    """
-    Generate a summary report of all governance metrics
-    """
-    
-    summary = f"""
+# Summary report layout, filled from the latest row of each dataset
+REPORT_TEMPLATE = """
 GOVERNANCE DATASET SUMMARY REPORT
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Generated: {generated}
 Company: Aurora Renewables (1-year-old company)
 Period: Last 5 quarters (1 year + current quarter)
 
@@ -206,10 +182,10 @@ Period: Last 5 quarters (1 year + current quarter)
 1. BOARD COMPOSITION
 ================================
 Latest Quarter Metrics:
-- Total Directors: {board_df['total_directors'].iloc[-1]}
-- Independent Directors: {board_df['independent_percent'].iloc[-1]}%
-- Female Directors: {board_df['female_percent'].iloc[-1]}%
-- Average Board Attendance: {board_df['average_attendance_percent'].iloc[-1]}%
+- Total Directors: {board_total_directors}
+- Independent Directors: {board_independent_percent}%
+- Female Directors: {board_female_percent}%
+- Average Board Attendance: {board_average_attendance_percent}%
 
 Trend: Steadily improving diversity and independence
 
@@ -217,9 +193,9 @@ Trend: Steadily improving diversity and independence
 2. COMPLIANCE METRICS
 ================================
 Latest Quarter Metrics:
-- Compliance Rate: {compliance_df['compliance_rate_percent'].iloc[-1]}%
-- Regulatory Violations: {compliance_df['regulatory_violations'].iloc[-1]}
-- Ethics Training Coverage: {compliance_df['employee_ethics_training_percent'].iloc[-1]}%
+- Compliance Rate: {compliance_compliance_rate_percent}%
+- Regulatory Violations: {compliance_regulatory_violations}
+- Ethics Training Coverage: {compliance_employee_ethics_training_percent}%
 
 Trend: Strong improvement in compliance, violations decreasing
 
@@ -227,14 +203,14 @@ Trend: Strong improvement in compliance, violations decreasing
 3. ESG RATINGS
 ================================
 Latest Quarter Metrics:
-- Overall ESG Score: {ratings_df['overall_esg_score'].iloc[-1]}/100
-- ESG Grade: {ratings_df['esg_grade'].iloc[-1]}
-- Environmental Score: {ratings_df['environmental_score'].iloc[-1]}
-- Social Score: {ratings_df['social_score'].iloc[-1]}
-- Governance Score: {ratings_df['governance_score'].iloc[-1]}
-- Industry Percentile: {ratings_df['industry_percentile_rank'].iloc[-1]} (Top {100 - ratings_df['industry_percentile_rank'].iloc[-1]:.0f}%)
-- ESG Risk: {ratings_df['esg_risk_rating'].iloc[-1]}
-- Carbon Disclosure: {ratings_df['carbon_disclosure_score'].iloc[-1]}
+- Overall ESG Score: {ratings_overall_esg_score}/100
+- ESG Grade: {ratings_esg_grade}
+- Environmental Score: {ratings_environmental_score}
+- Social Score: {ratings_social_score}
+- Governance Score: {ratings_governance_score}
+- Industry Percentile: {ratings_industry_percentile_rank} (Top {ratings_top_percent:.0f}%)
+- ESG Risk: {ratings_esg_risk_rating}
+- Carbon Disclosure: {ratings_carbon_disclosure_score}
 
 Trend: Consistent improvement across all ESG dimensions
 
@@ -242,10 +218,10 @@ Trend: Consistent improvement across all ESG dimensions
 4. TRANSPARENCY & DISCLOSURE
 ================================
 Latest Quarter Metrics:
-- Data Disclosure Completeness: {transparency_df['data_disclosure_completeness_percent'].iloc[-1]}%
-- Verified Metrics: {transparency_df['verification_percent'].iloc[-1]}%
-- ESG Report Status: {transparency_df['esg_report_published'].iloc[-1]}
-- Public Commitments on Track: {transparency_df['commitments_on_track_percent'].iloc[-1]}%
+- Data Disclosure Completeness: {transparency_data_disclosure_completeness_percent}%
+- Verified Metrics: {transparency_verification_percent}%
+- ESG Report Status: {transparency_esg_report_published}
+- Public Commitments on Track: {transparency_commitments_on_track_percent}%
 
 Trend: Increasing transparency and third-party verification
 
@@ -253,13 +229,13 @@ Trend: Increasing transparency and third-party verification
 FILE SUMMARY
 ================================
 Total Files Generated: 4 CSV files + 1 summary report
-Total Data Points: {len(board_df) + len(compliance_df) + len(ratings_df) + len(transparency_df)} records
+Total Data Points: {total_records} records
 
 Files:
-1. board_composition_quarterly.csv ({len(board_df)} rows)
-2. compliance_metrics_quarterly.csv ({len(compliance_df)} rows)
-3. esg_ratings_quarterly.csv ({len(ratings_df)} rows)
-4. transparency_disclosure_quarterly.csv ({len(transparency_df)} rows)
+1. board_composition_quarterly.csv ({board_rows} rows)
+2. compliance_metrics_quarterly.csv ({compliance_rows} rows)
+3. esg_ratings_quarterly.csv ({ratings_rows} rows)
+4. transparency_disclosure_quarterly.csv ({transparency_rows} rows)
 
 ================================
 INSIGHTS FOR 1-YEAR-OLD COMPANY
@@ -274,9 +250,27 @@ INSIGHTS FOR 1-YEAR-OLD COMPANY
 
 ================================
 """
+
+def generate_summary_report(board_df, compliance_df, ratings_df, transparency_df):
+    """
+    Generate a summary report of all governance metrics
+    """
+    
+    # Latest row of each dataset, flattened into prefix_column keys
+    ctx = {}
+    for prefix, df in (("board", board_df), ("compliance", compliance_df),
+                       ("ratings", ratings_df), ("transparency", transparency_df)):
+        ctx.update({f"{prefix}_{col}": value for col, value in df.iloc[-1].items()})
+        ctx[f"{prefix}_rows"] = len(df)
+    ctx["generated"] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    ctx["ratings_top_percent"] = 100 - ctx["ratings_industry_percentile_rank"]
+    ctx["total_records"] = len(board_df) + len(compliance_df) + len(ratings_df) + len(transparency_df)
+    
+    # Encode once and write the bytes in a single unbuffered call
+    summary = REPORT_TEMPLATE.format_map(ctx).encode('utf-8')
     
     output_path = os.path.join(OUTPUT_DIR, 'summary_report.txt')
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with open(output_path, 'wb', buffering=0) as f:
         f.write(summary)
     
     print(f"✅ Generated: {output_path}")
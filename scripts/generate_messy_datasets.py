@@ -15,56 +15,97 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import random
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pac
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 
 
-def sample_indices(length: int, fraction: float, rng: random.Random) -> List[int]:
+def sample_indices(length: int, fraction: float, gen: np.random.Generator) -> np.ndarray:
     """Return unique indices based on a fraction of total length."""
 
     count = max(1, int(length * fraction))
-    return rng.sample(range(length), count)
+    return gen.choice(length, count, replace=False)
 
 
-def insert_duplicates(df: pd.DataFrame, how_many: int, rng: random.Random) -> pd.DataFrame:
+def insert_duplicates(df: pd.DataFrame, how_many: int, gen: np.random.Generator) -> pd.DataFrame:
     """Append a handful of duplicate rows (with slight timestamp jitter)."""
 
-    dup_rows = df.sample(n=min(how_many, len(df)), replace=False, random_state=rng.randint(0, 1_000_000))
-    dup_rows = dup_rows.copy()
-    date_cols = [c for c in dup_rows.columns if dup_rows[c].dtype == 'datetime64[ns]']
-    for col in date_cols:
-        jitter_days = rng.choices([-1, 0, 1], k=len(dup_rows))
-        dup_rows[col] = dup_rows[col] + pd.to_timedelta(jitter_days, unit='D')
-    dup_rows['data_issue_flag'] = 'duplicate_injected'
-    return pd.concat([df, dup_rows], ignore_index=True)
+    n = len(df)
+    dup_idx = gen.choice(n, size=min(how_many, n), replace=False)
+    # Gather the original rows followed by the duplicates in one take, so the
+    # output is allocated once instead of copying the duplicates and concatenating.
+    out = df.take(np.concatenate([np.arange(n), dup_idx]))
+    out.index = pd.RangeIndex(len(out))
+    date_pos = [i for i, dtype in enumerate(out.dtypes) if dtype == 'datetime64[ns]']
+    if date_pos:
+        # One draw of -1/0/+1 days for every date cell of the duplicates.
+        jitter = gen.integers(-1, 2, size=(len(dup_idx), len(date_pos))).astype('timedelta64[D]')
+        out.iloc[n:, date_pos] = out.iloc[n:, date_pos].to_numpy() + jitter
+    flag = np.full(len(out), np.nan, dtype=object)
+    flag[n:] = 'duplicate_injected'
+    out['data_issue_flag'] = flag
+    return out
 
 
-def apply_missing_values(df: pd.DataFrame, columns: Iterable[str], fraction: float, rng: random.Random) -> None:
+def _scatter(df: pd.DataFrame, pos: int, idx, values, dtype=None) -> None:
+    """Write values at row positions idx of column pos through its NumPy array."""
+
+    column = df.iloc[:, pos].to_numpy(dtype=dtype, copy=True)
+    column[idx] = values
+    df.isetitem(pos, column)
+
+
+def apply_missing_values(df: pd.DataFrame, columns: Iterable[str], fraction: float, gen: np.random.Generator) -> None:
     """Set a fraction of values in each column to NaN."""
 
-    for col in columns:
-        if col not in df.columns:
-            continue
-        n_missing = max(1, int(len(df) * fraction))
-        missing_idx = rng.sample(range(len(df)), n_missing)
-        df.loc[missing_idx, col] = np.nan
+    col_idx = [pos for pos in df.columns.get_indexer(list(columns)) if pos >= 0]
+    n_missing = max(1, int(len(df) * fraction))
+    for pos in col_idx:
+        missing_idx = gen.choice(len(df), n_missing, replace=False)
+        # Integer columns become float so they can hold NaN.
+        dtype = float if df.dtypes.iloc[pos].kind in 'iub' else None
+        _scatter(df, pos, missing_idx, np.nan, dtype)
+
+
+# String formats used by convert_to_strings: kind -> (multiplier, divisor, format).
+STRING_FORMATS = {
+    'km': (1, 1, '{:,.0f} km'),
+    'tco2e': (1, 1, '{:.3f} tCO2e'),
+    'per_unit': (1, 1, '{:.3f} /unit'),
+    'mwh_from_kwh': (1, 1000, '{:.2f} MWh'),
+    'mwh': (1, 1, '{:.1f} MWh'),
+    'percent': (100, 1, '{:.1f}%'),
+    'litres_from_m3': (1000, 1, '{:.0f} L'),
+    'm3': (1, 1, '{:.1f} m3'),
+    'kg_from_tons': (1000, 1, '{:.0f} kg'),
+    'tons': (1, 1, '{:.2f} t'),
+    'ugm3': (1, 1, '{:.1f} μg/m3'),
+    'ppm': (1, 1, '{:.2f} ppm'),
+}
 
 
-def convert_to_strings(df: pd.DataFrame, column: str, formatter, fraction: float, rng: random.Random) -> None:
-    """Convert a fraction of column values to formatted strings."""
+def convert_to_strings(df: pd.DataFrame, column: str, kind: str, fraction: float, gen: np.random.Generator) -> None:
+    """Convert a fraction of column values to formatted strings (see STRING_FORMATS)."""
 
     if column not in df:
         return
-    # Ensure column can hold string representations.
-    df[column] = df[column].astype(object)
-    idx = sample_indices(len(df), fraction, rng)
-    df.loc[idx, column] = df.loc[idx, column].apply(formatter)
+    multiplier, divisor, fmt = STRING_FORMATS[kind]
+    pos = df.columns.get_loc(column)
+    idx = sample_indices(len(df), fraction, gen)
+    # Unit conversion runs over the whole selection at once; only the final
+    # formatting is per value.
+    values = df.iloc[idx, pos].to_numpy(dtype=float) * multiplier / divisor
+    # The column becomes object so it can hold string representations.
+    _scatter(df, pos, idx, list(map(fmt.format, values.tolist())), object)
 
 
 def parse_gcs_uri(uri: str) -> Tuple[str, str]:
@@ -78,18 +119,41 @@ def parse_gcs_uri(uri: str) -> Tuple[str, str]:
     return bucket, prefix.rstrip('/')
 
 
-def add_numeric_spikes(df: pd.DataFrame, column: str, fraction: float, factor_range: tuple[float, float], rng: random.Random) -> None:
+def add_numeric_spikes(
+    df: pd.DataFrame,
+    column: str,
+    fraction: float,
+    factor_range: tuple[float, float],
+    gen: np.random.Generator,
+) -> None:
     """Multiply some values by a spike factor to mimic anomalies."""
 
     if column not in df:
         return
-    idx = sample_indices(len(df), fraction, rng)
-    factors = np.array([rng.uniform(*factor_range) for _ in idx])
-    df.loc[idx, column] = df.loc[idx, column] * factors
-
-
-def random_case(text: str, rng: random.Random) -> str:
-    return ''.join(rng.choice([ch.lower(), ch.upper()]) for ch in text)
+    idx = sample_indices(len(df), fraction, gen)
+    factors = gen.uniform(*factor_range, size=len(idx))
+    vals = df[column].to_numpy(copy=True)
+    if vals.dtype.kind in 'iub':
+        vals = vals.astype(float)
+    elif vals.dtype == object:
+        # Skip cells convert_to_strings already turned into strings. Earlier
+        # versions multiplied them too, which raised TypeError and aborted the
+        # dataset whenever a spike landed on one.
+        numeric = np.array([not isinstance(v, str) for v in vals[idx]], dtype=bool)
+        idx, factors = idx[numeric], factors[numeric]
+    vals[idx] *= factors
+    df[column] = vals
+
+
+def random_case(values: pd.Series, gen: np.random.Generator) -> pd.Series:
+    """Randomly upper- or lower-case every character of every string."""
+
+    text = values.to_numpy(dtype=str)
+    # View the fixed-width strings as a (rows, characters) grid of single
+    # characters; the zero padding is unaffected by case changes.
+    chars = text.view('U1').reshape(len(text), -1)
+    mixed = np.where(gen.random(chars.shape) < 0.5, np.char.upper(chars), np.char.lower(chars))
+    return pd.Series(mixed.view(text.dtype).ravel(), index=values.index, dtype=object)
 
 
 @dataclass
@@ -98,80 +162,74 @@ class DatasetSpec:
     kind: str
 
 
-def make_travel_messy(df: pd.DataFrame, rng: random.Random) -> pd.DataFrame:
-    df = df.copy()
-    drop_idx = sample_indices(len(df), fraction=0.03, rng=rng)
+def make_travel_messy(df: pd.DataFrame, gen: np.random.Generator) -> pd.DataFrame:
+    drop_idx = sample_indices(len(df), fraction=0.03, gen=gen)
     df = df.drop(index=drop_idx).reset_index(drop=True)
 
-    apply_missing_values(df, ['flights', 'road_trips'], 0.04, rng)
-    convert_to_strings(df, 'total_distance_km', lambda v: f"{v:,.0f} km", 0.08, rng)
-    convert_to_strings(df, 'travel_tco2e', lambda v: f"{v:.3f} tCO2e", 0.07, rng)
+    apply_missing_values(df, ['flights', 'road_trips'], 0.04, gen)
+    convert_to_strings(df, 'total_distance_km', 'km', 0.08, gen)
+    convert_to_strings(df, 'travel_tco2e', 'tco2e', 0.07, gen)
 
-    add_numeric_spikes(df, 'travel_tco2e', 0.015, (1.4, 1.9), rng)
-    df['source_tag'] = df['source_tag'].apply(lambda s: random_case(s, rng))
-    df = insert_duplicates(df, how_many=8, rng=rng)
+    add_numeric_spikes(df, 'travel_tco2e', 0.015, (1.4, 1.9), gen)
+    df['source_tag'] = random_case(df['source_tag'], gen)
+    df = insert_duplicates(df, how_many=8, gen=gen)
     return df
 
 
-def make_production_messy(df: pd.DataFrame, rng: random.Random) -> pd.DataFrame:
-    df = df.copy()
-    apply_missing_values(df, ['production_units'], 0.03, rng)
-    convert_to_strings(df, 'emission_intensity_tco2e_per_unit', lambda v: f"{v:.3f} /unit", 0.1, rng)
-    add_numeric_spikes(df, 'production_tco2e', 0.02, (0.5, 2.3), rng)
-    df = insert_duplicates(df, how_many=5, rng=rng)
+def make_production_messy(df: pd.DataFrame, gen: np.random.Generator) -> pd.DataFrame:
+    apply_missing_values(df, ['production_units'], 0.03, gen)
+    convert_to_strings(df, 'emission_intensity_tco2e_per_unit', 'per_unit', 0.1, gen)
+    add_numeric_spikes(df, 'production_tco2e', 0.02, (0.5, 2.3), gen)
+    df = insert_duplicates(df, how_many=5, gen=gen)
     return df
 
 
-def make_energy_daily_messy(df: pd.DataFrame, rng: random.Random) -> pd.DataFrame:
-    df = df.copy()
-    apply_missing_values(df, ['electricity_kwh'], 0.05, rng)
-    convert_to_strings(df, 'electricity_kwh', lambda v: f"{v/1000:.2f} MWh", 0.07, rng)
-    convert_to_strings(df, 'natural_gas_mwh', lambda v: f"{v:.1f} MWh", 0.06, rng)
-    add_numeric_spikes(df, 'peak_demand_kw', 0.02, (1.3, 2.1), rng)
-    df = insert_duplicates(df, how_many=6, rng=rng)
+def make_energy_daily_messy(df: pd.DataFrame, gen: np.random.Generator) -> pd.DataFrame:
+    apply_missing_values(df, ['electricity_kwh'], 0.05, gen)
+    convert_to_strings(df, 'electricity_kwh', 'mwh_from_kwh', 0.07, gen)
+    convert_to_strings(df, 'natural_gas_mwh', 'mwh', 0.06, gen)
+    add_numeric_spikes(df, 'peak_demand_kw', 0.02, (1.3, 2.1), gen)
+    df = insert_duplicates(df, how_many=6, gen=gen)
     return df
 
 
-def make_energy_mix_messy(df: pd.DataFrame, rng: random.Random) -> pd.DataFrame:
-    df = df.copy()
-    convert_to_strings(df, 'renewable_share', lambda v: f"{v*100:.1f}%", 0.3, rng)
-    convert_to_strings(df, 'non_renewable_share', lambda v: f"{v*100:.1f}%", 0.3, rng)
-    apply_missing_values(df, ['renewable_share'], 0.08, rng)
-    df = insert_duplicates(df, how_many=2, rng=rng)
+def make_energy_mix_messy(df: pd.DataFrame, gen: np.random.Generator) -> pd.DataFrame:
+    convert_to_strings(df, 'renewable_share', 'percent', 0.3, gen)
+    convert_to_strings(df, 'non_renewable_share', 'percent', 0.3, gen)
+    apply_missing_values(df, ['renewable_share'], 0.08, gen)
+    df = insert_duplicates(df, how_many=2, gen=gen)
     return df
 
 
-def make_water_messy(df: pd.DataFrame, rng: random.Random) -> pd.DataFrame:
-    df = df.copy()
-    drop_idx = sample_indices(len(df), 0.02, rng)
+def make_water_messy(df: pd.DataFrame, gen: np.random.Generator) -> pd.DataFrame:
+    drop_idx = sample_indices(len(df), 0.02, gen)
     df = df.drop(index=drop_idx).reset_index(drop=True)
-    apply_missing_values(df, ['water_withdrawn_m3', 'water_recycled_m3'], 0.06, rng)
-    convert_to_strings(df, 'water_withdrawn_m3', lambda v: f"{v*1000:.0f} L", 0.05, rng)
-    convert_to_strings(df, 'water_discharge_m3', lambda v: f"{v:.1f} m3", 0.05, rng)
-    df = insert_duplicates(df, how_many=5, rng=rng)
+    apply_missing_values(df, ['water_withdrawn_m3', 'water_recycled_m3'], 0.06, gen)
+    convert_to_strings(df, 'water_withdrawn_m3', 'litres_from_m3', 0.05, gen)
+    convert_to_strings(df, 'water_discharge_m3', 'm3', 0.05, gen)
+    df = insert_duplicates(df, how_many=5, gen=gen)
     return df
 
 
-def make_waste_messy(df: pd.DataFrame, rng: random.Random) -> pd.DataFrame:
-    df = df.copy()
-    convert_to_strings(df, 'hazardous_waste_tons', lambda v: f"{v*1000:.0f} kg", 0.2, rng)
-    convert_to_strings(df, 'non_hazardous_waste_tons', lambda v: f"{v:.2f} t", 0.2, rng)
-    apply_missing_values(df, ['recycled_fraction'], 0.1, rng)
-    df = insert_duplicates(df, how_many=2, rng=rng)
+def make_waste_messy(df: pd.DataFrame, gen: np.random.Generator) -> pd.DataFrame:
+    convert_to_strings(df, 'hazardous_waste_tons', 'kg_from_tons', 0.2, gen)
+    convert_to_strings(df, 'non_hazardous_waste_tons', 'tons', 0.2, gen)
+    apply_missing_values(df, ['recycled_fraction'], 0.1, gen)
+    df = insert_duplicates(df, how_many=2, gen=gen)
     return df
 
 
-def make_air_quality_messy(df: pd.DataFrame, rng: random.Random) -> pd.DataFrame:
-    df = df.copy()
-    apply_missing_values(df, ['aqi', 'pm25_ugm3', 'pm10_ugm3'], 0.04, rng)
-    convert_to_strings(df, 'pm25_ugm3', lambda v: f"{v:.1f} μg/m3", 0.12, rng)
-    convert_to_strings(df, 'co_ppm', lambda v: f"{v:.2f} ppm", 0.1, rng)
-    df['sensor_id'] = df['sensor_id'].apply(lambda s: random_case(s, rng))
-    df = insert_duplicates(df, how_many=7, rng=rng)
-    add_numeric_spikes(df, 'aqi', 0.02, (0.4, 1.8), rng)
+def make_air_quality_messy(df: pd.DataFrame, gen: np.random.Generator) -> pd.DataFrame:
+    apply_missing_values(df, ['aqi', 'pm25_ugm3', 'pm10_ugm3'], 0.04, gen)
+    convert_to_strings(df, 'pm25_ugm3', 'ugm3', 0.12, gen)
+    convert_to_strings(df, 'co_ppm', 'ppm', 0.1, gen)
+    df['sensor_id'] = random_case(df['sensor_id'], gen)
+    df = insert_duplicates(df, how_many=7, gen=gen)
+    add_numeric_spikes(df, 'aqi', 0.02, (0.4, 1.8), gen)
     return df
 
 
+# Transformers take ownership of the frame they are given and may modify it in place.
 CORRUPTION_PIPELINE = {
     'company_travel_emissions_daily.csv': make_travel_messy,
     'company_production_emissions_daily.csv': make_production_messy,
@@ -183,60 +241,116 @@ CORRUPTION_PIPELINE = {
 }
 
 
+# The clean baselines all carry an ISO 'date' column; every other type is inferred.
+READ_OPTIONS = pac.ConvertOptions(column_types={'date': pa.timestamp('ns')})
+
+
+def read_source(path: Path) -> pd.DataFrame:
+    """Read a clean baseline CSV with Arrow's multi-threaded parser."""
+
+    return pac.read_csv(path, convert_options=READ_OPTIONS).to_pandas(self_destruct=True)
+
+
+OUTPUT_FORMATS = ('parquet', 'csv')
+
+
+def write_messy(df: pd.DataFrame, path: Path, output_format: str) -> None:
+    if output_format == 'parquet':
+        # Arrow needs one type per column, so columns mixing formatted strings
+        # with numbers are stored as text - which is also how they read back
+        # from CSV.
+        for col in df.select_dtypes(include='object').columns:
+            df[col] = df[col].map(str, na_action='ignore')
+        df.to_parquet(path, engine='pyarrow', compression='snappy', index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Generate messy ESG datasets from clean baselines.')
     parser.add_argument('--input-dir', type=Path, required=True, help='Directory containing clean CSV files.')
-    parser.add_argument('--output-dir', type=Path, required=True, help='Destination for messy CSV files.')
+    parser.add_argument('--output-dir', type=Path, required=True, help='Destination for messy files.')
     parser.add_argument('--seed', type=int, default=1234, help='Random seed for reproducibility.')
     parser.add_argument('--upload-gcs', type=str, help='Optional gs://bucket/prefix destination for uploading messy files.')
+    parser.add_argument('--format', dest='output_format', choices=OUTPUT_FORMATS, default='parquet', help='File format for messy outputs (default: parquet).')
     return parser.parse_args()
 
+
+def _process_one(
+    filename: str,
+    seed: np.random.SeedSequence,
+    input_dir: Path,
+    output_dir: Path,
+    output_format: str,
+) -> Optional[Path]:
+    """Corrupt one baseline file; runs in a worker process."""
+
+    source_path = input_dir / filename
+    if not source_path.exists():
+        print(f"[WARN] Missing source file: {source_path}")
+        return None
+
+    gen = np.random.default_rng(seed)
+
+    df = read_source(source_path)
+    messy_df = CORRUPTION_PIPELINE[filename](df, gen)
+
+    messy_path = output_dir / filename.replace('.csv', f'_messy.{output_format}')
+    write_messy(messy_df, messy_path, output_format)
+    print(f"Wrote messy dataset: {messy_path} ({len(messy_df)} rows)")
+    return messy_path
+
+
 def generate_messy_datasets(
     input_dir: Path,
     output_dir: Path,
     seed: int = 1234,
     upload_gcs: Optional[str] = None,
+    output_format: str = 'parquet',
 ) -> List[Path]:
-    rng = random.Random(seed)
-    np.random.seed(seed)
-
     if not input_dir.exists():
         raise FileNotFoundError(f"Input directory '{input_dir}' does not exist")
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    generated_files: List[Path] = []
-
-    for filename, transformer in CORRUPTION_PIPELINE.items():
-        source_path = input_dir / filename
-        if not source_path.exists():
-            print(f"[WARN] Missing source file: {source_path}")
-            continue
-
-        df = pd.read_csv(source_path, parse_dates=['date'])
-        messy_df = transformer(df, rng)
-
-        messy_path = output_dir / filename.replace('.csv', '_messy.csv')
-        messy_df.to_csv(messy_path, index=False)
-        generated_files.append(messy_path)
-        print(f"Wrote messy dataset: {messy_path} ({len(messy_df)} rows)")
+    # The files are independent, so each gets its own process and its own
+    # child seed; results stay reproducible regardless of scheduling.
+    child_seeds = np.random.SeedSequence(seed).spawn(len(CORRUPTION_PIPELINE))
+    with ProcessPoolExecutor(max_workers=min(len(CORRUPTION_PIPELINE), os.cpu_count() or 1)) as pool:
+        futures = [
+            pool.submit(_process_one, filename, child_seed, input_dir, output_dir, output_format)
+            for filename, child_seed in zip(CORRUPTION_PIPELINE, child_seeds)
+        ]
+        results = [future.result() for future in futures]
+    generated_files: List[Path] = [path for path in results if path is not None]
 
     if upload_gcs and generated_files:
         bucket_name, prefix = parse_gcs_uri(upload_gcs)
         client = storage.Client()
         bucket = client.bucket(bucket_name)
-        for path in generated_files:
-            destination = f"{prefix}/{path.name}" if prefix else path.name
-            blob = bucket.blob(destination)
-            blob.upload_from_filename(path)
-            print(f"Uploaded to gs://{bucket_name}/{destination}")
+        blob_prefix = f"{prefix}/" if prefix else ''
+        # Uploads are network-bound, so threads overlap them on one client.
+        results = transfer_manager.upload_many_from_filenames(
+            bucket,
+            [path.name for path in generated_files],
+            source_directory=str(output_dir),
+            blob_name_prefix=blob_prefix,
+            worker_type=transfer_manager.THREAD,
+            max_workers=8,
+        )
+        for path, result in zip(generated_files, results):
+            destination = f"{blob_prefix}{path.name}"
+            if isinstance(result, Exception):
+                print(f"[WARN] Failed to upload {path} to gs://{bucket_name}/{destination}: {result}")
+            else:
+                print(f"Uploaded to gs://{bucket_name}/{destination}")
 
     return generated_files
 
 
 def main() -> None:
     args = parse_args()
-    generate_messy_datasets(args.input_dir, args.output_dir, args.seed, args.upload_gcs)
+    generate_messy_datasets(args.input_dir, args.output_dir, args.seed, args.upload_gcs, args.output_format)
 
 
 if __name__ == '__main__':
@@ -4,7 +4,7 @@ Generates realistic social metrics for a year-old renewable energy company
 """
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
 # Output directory
@@ -15,6 +15,9 @@ OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 START_DATE = datetime(2024, 11, 9)
 END_DATE = datetime(2025, 11, 8)
 
+# Monthly labels (30 days apart) shared by the monthly datasets
+MONTH_LABELS = pd.date_range(START_DATE, END_DATE, freq='30D').strftime("%Y-%m").tolist()
+
 def generate_employee_wellbeing():
     """
     Generate monthly employee wellbeing metrics
@@ -22,39 +25,32 @@ def generate_employee_wellbeing():
     """
     print("📊 Generating Employee Wellbeing data...")
     
-    dates = []
-    current_date = START_DATE
-    
     # Generate monthly data for 12 months
-    while current_date <= END_DATE:
-        dates.append(current_date.strftime("%Y-%m"))
-        current_date += timedelta(days=30)
+    dates = MONTH_LABELS
     
-    data = []
+    # One array per column, one random draw per column
+    n = len(dates)
+    i = np.arange(n)
     base_satisfaction = 7.8
     base_training = 12
     
-    for i, month in enumerate(dates):
-        # Gradual improvement over time with some variance
-        satisfaction_trend = 0.05 * i  # Improves over time
-        satisfaction = base_satisfaction + satisfaction_trend + np.random.uniform(-0.3, 0.3)
-        satisfaction = min(10, max(6, satisfaction))  # Keep between 6-10
-        
-        # Training hours vary by quarter (more training in Q1, Q3)
-        quarter_boost = 5 if i % 3 == 0 else 0
-        training_hours = base_training + quarter_boost + np.random.uniform(-3, 5)
-        training_hours = max(5, training_hours)
-        
-        # Employee count grows over time
-        employee_count = 450 + i * 5 + np.random.randint(-5, 10)
-        
-        data.append({
-            "month": month,
-            "satisfaction_score": round(satisfaction, 2),
-            "training_hours_per_employee": round(training_hours, 1),
-            "total_employees": employee_count,
-            "response_rate_percent": round(np.random.uniform(78, 95), 1)
-        })
+    # Gradual improvement over time with some variance, kept between 6-10
+    satisfaction = np.clip(base_satisfaction + 0.05 * i + np.random.uniform(-0.3, 0.3, size=n), 6, 10)
+    
+    # Training hours vary by quarter (more training in Q1, Q3)
+    quarter_boost = np.where(i % 3 == 0, 5, 0)
+    training_hours = np.maximum(5, base_training + quarter_boost + np.random.uniform(-3, 5, size=n))
+    
+    # Employee count grows over time
+    employee_count = 450 + i * 5 + np.random.randint(-5, 10, size=n)
+    
+    data = {
+        "month": dates,
+        "satisfaction_score": np.round(satisfaction, 2),
+        "training_hours_per_employee": np.round(training_hours, 1),
+        "total_employees": employee_count,
+        "response_rate_percent": np.round(np.random.uniform(78, 95, size=n), 1)
+    }
     
     df = pd.DataFrame(data)
     output_file = OUTPUT_DIR / "employee_wellbeing_monthly.csv"
@@ -78,37 +74,35 @@ def generate_diversity_inclusion():
         "2025-Q4"
     ]
     
-    data = []
+    n = len(quarters)
+    i = np.arange(n)
     base_female_percent = 42
     
-    for i, quarter in enumerate(quarters):
-        # Gradual improvement in diversity
-        female_percent = base_female_percent + i * 1.2 + np.random.uniform(-1, 2)
-        female_percent = min(52, max(40, female_percent))
-        
-        # Age distribution (should sum to 100%)
-        age_under_30 = np.random.uniform(25, 32)
-        age_30_40 = np.random.uniform(35, 42)
-        age_40_50 = np.random.uniform(18, 25)
-        age_over_50 = 100 - (age_under_30 + age_30_40 + age_40_50)
-        
-        # Leadership diversity
-        female_leadership = female_percent * 0.85 + np.random.uniform(-2, 3)
-        female_leadership = min(50, max(35, female_leadership))
-        
-        minority_employees = np.random.uniform(30, 40)
-        
-        data.append({
-            "quarter": quarter,
-            "female_employees_percent": round(female_percent, 1),
-            "female_leadership_percent": round(female_leadership, 1),
-            "minority_employees_percent": round(minority_employees, 1),
-            "age_under_30_percent": round(age_under_30, 1),
-            "age_30_40_percent": round(age_30_40, 1),
-            "age_40_50_percent": round(age_40_50, 1),
-            "age_over_50_percent": round(age_over_50, 1),
-            "pay_equity_ratio": round(np.random.uniform(0.94, 0.99), 3)
-        })
+    # Gradual improvement in diversity
+    female_percent = np.clip(base_female_percent + i * 1.2 + np.random.uniform(-1, 2, size=n), 40, 52)
+    
+    # Age distribution (should sum to 100%)
+    age_under_30 = np.random.uniform(25, 32, size=n)
+    age_30_40 = np.random.uniform(35, 42, size=n)
+    age_40_50 = np.random.uniform(18, 25, size=n)
+    age_over_50 = 100 - (age_under_30 + age_30_40 + age_40_50)
+    
+    # Leadership diversity
+    female_leadership = np.clip(female_percent * 0.85 + np.random.uniform(-2, 3, size=n), 35, 50)
+    
+    minority_employees = np.random.uniform(30, 40, size=n)
+    
+    data = {
+        "quarter": quarters,
+        "female_employees_percent": np.round(female_percent, 1),
+        "female_leadership_percent": np.round(female_leadership, 1),
+        "minority_employees_percent": np.round(minority_employees, 1),
+        "age_under_30_percent": np.round(age_under_30, 1),
+        "age_30_40_percent": np.round(age_30_40, 1),
+        "age_40_50_percent": np.round(age_40_50, 1),
+        "age_over_50_percent": np.round(age_over_50, 1),
+        "pay_equity_ratio": np.round(np.random.uniform(0.94, 0.99, size=n), 3)
+    }
     
     df = pd.DataFrame(data)
     output_file = OUTPUT_DIR / "diversity_inclusion_quarterly.csv"
@@ -131,44 +125,42 @@ def generate_community_impact():
         "2025-Q4"
     ]
     
-    data = []
-    
-    for i, quarter in enumerate(quarters):
-        # Growing community engagement over time
-        base_volunteer = 800
-        volunteer_hours = base_volunteer + i * 150 + np.random.uniform(-100, 200)
-        volunteer_hours = max(600, volunteer_hours)
-        
-        # Donations increase over time as company grows
-        base_donation = 75000
-        total_donations = base_donation + i * 15000 + np.random.uniform(-10000, 20000)
-        total_donations = max(50000, total_donations)
-        
-        # Break down donation categories
-        education = total_donations * np.random.uniform(0.35, 0.45)
-        environment = total_donations * np.random.uniform(0.30, 0.40)
-        local_business = total_donations - education - environment
-        
-        # Number of employees participating in volunteering
-        employee_participation = np.random.uniform(55, 75)
-        
-        # Community programs supported
-        programs_supported = np.random.randint(8, 15)
-        
-        # Beneficiaries reached
-        beneficiaries = int(volunteer_hours * np.random.uniform(2, 4))
-        
-        data.append({
-            "quarter": quarter,
-            "volunteer_hours": round(volunteer_hours, 0),
-            "employee_participation_percent": round(employee_participation, 1),
-            "total_donations_usd": round(total_donations, 2),
-            "education_donations_usd": round(education, 2),
-            "environmental_donations_usd": round(environment, 2),
-            "local_business_support_usd": round(local_business, 2),
-            "programs_supported": programs_supported,
-            "beneficiaries_reached": beneficiaries
-        })
+    n = len(quarters)
+    i = np.arange(n)
+    
+    # Growing community engagement over time
+    base_volunteer = 800
+    volunteer_hours = np.maximum(600, base_volunteer + i * 150 + np.random.uniform(-100, 200, size=n))
+    
+    # Donations increase over time as company grows
+    base_donation = 75000
+    total_donations = np.maximum(50000, base_donation + i * 15000 + np.random.uniform(-10000, 20000, size=n))
+    
+    # Break down donation categories
+    education = total_donations * np.random.uniform(0.35, 0.45, size=n)
+    environment = total_donations * np.random.uniform(0.30, 0.40, size=n)
+    local_business = total_donations - education - environment
+    
+    # Number of employees participating in volunteering
+    employee_participation = np.random.uniform(55, 75, size=n)
+    
+    # Community programs supported
+    programs_supported = np.random.randint(8, 15, size=n)
+    
+    # Beneficiaries reached
+    beneficiaries = (volunteer_hours * np.random.uniform(2, 4, size=n)).astype(int)
+    
+    data = {
+        "quarter": quarters,
+        "volunteer_hours": np.round(volunteer_hours, 0),
+        "employee_participation_percent": np.round(employee_participation, 1),
+        "total_donations_usd": np.round(total_donations, 2),
+        "education_donations_usd": np.round(education, 2),
+        "environmental_donations_usd": np.round(environment, 2),
+        "local_business_support_usd": np.round(local_business, 2),
+        "programs_supported": programs_supported,
+        "beneficiaries_reached": beneficiaries
+    }
     
     df = pd.DataFrame(data)
     output_file = OUTPUT_DIR / "community_impact_quarterly.csv"
@@ -183,57 +175,51 @@ def generate_health_safety():
     """
     print("📊 Generating Health & Safety data...")
     
-    dates = []
-    current_date = START_DATE
-    
     # Generate monthly data for 12 months
-    while current_date <= END_DATE:
-        dates.append(current_date.strftime("%Y-%m"))
-        current_date += timedelta(days=30)
-    
-    data = []
-    
-    for i, month in enumerate(dates):
-        # Total hours worked increases as company grows
-        employees = 450 + i * 5
-        hours_per_employee = 160  # ~40 hours/week * 4 weeks
-        total_hours_worked = employees * hours_per_employee
-        
-        # Incident rate improves over time (better safety culture)
-        base_incident_rate = 2.5  # incidents per 1000 hours
-        improvement = i * 0.15
-        incident_rate = max(0.5, base_incident_rate - improvement + np.random.uniform(-0.3, 0.5))
-        
-        # Calculate actual incidents
-        total_incidents = int((incident_rate * total_hours_worked) / 1000)
-        total_incidents = max(0, total_incidents)
-        
-        # Lost time incidents (more serious)
-        lost_time_incidents = max(0, int(total_incidents * np.random.uniform(0.1, 0.3)))
-        
-        # Near misses (higher as safety culture improves - more reporting)
-        near_misses = int(total_incidents * np.random.uniform(3, 8))
-        
-        # Safety training completion improves over time
-        training_completion = min(100, 85 + i * 1.2 + np.random.uniform(-2, 3))
-        
-        # Days without incident (varies)
-        days_without_incident = np.random.randint(20, 90)
-        
-        # First aid cases
-        first_aid_cases = int(total_incidents * np.random.uniform(1.5, 3))
-        
-        data.append({
-            "month": month,
-            "total_hours_worked": total_hours_worked,
-            "total_incidents": total_incidents,
-            "incident_rate_per_1000_hours": round(incident_rate, 2),
-            "lost_time_incidents": lost_time_incidents,
-            "near_misses_reported": near_misses,
-            "first_aid_cases": first_aid_cases,
-            "safety_training_completion_percent": round(training_completion, 1),
-            "days_without_major_incident": days_without_incident
-        })
+    dates = MONTH_LABELS
+    
+    n = len(dates)
+    i = np.arange(n)
+    
+    # Total hours worked increases as company grows
+    employees = 450 + i * 5
+    hours_per_employee = 160  # ~40 hours/week * 4 weeks
+    total_hours_worked = employees * hours_per_employee
+    
+    # Incident rate improves over time (better safety culture)
+    base_incident_rate = 2.5  # incidents per 1000 hours
+    improvement = i * 0.15
+    incident_rate = np.maximum(0.5, base_incident_rate - improvement + np.random.uniform(-0.3, 0.5, size=n))
+    
+    # Calculate actual incidents
+    total_incidents = np.maximum(0, (incident_rate * total_hours_worked / 1000).astype(int))
+    
+    # Lost time incidents (more serious)
+    lost_time_incidents = np.maximum(0, (total_incidents * np.random.uniform(0.1, 0.3, size=n)).astype(int))
+    
+    # Near misses (higher as safety culture improves - more reporting)
+    near_misses = (total_incidents * np.random.uniform(3, 8, size=n)).astype(int)
+    
+    # Safety training completion improves over time
+    training_completion = np.minimum(100, 85 + i * 1.2 + np.random.uniform(-2, 3, size=n))
+    
+    # Days without incident (varies)
+    days_without_incident = np.random.randint(20, 90, size=n)
+    
+    # First aid cases
+    first_aid_cases = (total_incidents * np.random.uniform(1.5, 3, size=n)).astype(int)
+    
+    data = {
+        "month": dates,
+        "total_hours_worked": total_hours_worked,
+        "total_incidents": total_incidents,
+        "incident_rate_per_1000_hours": np.round(incident_rate, 2),
+        "lost_time_incidents": lost_time_incidents,
+        "near_misses_reported": near_misses,
+        "first_aid_cases": first_aid_cases,
+        "safety_training_completion_percent": np.round(training_completion, 1),
+        "days_without_major_incident": days_without_incident
+    }
     
     df = pd.DataFrame(data)
     output_file = OUTPUT_DIR / "health_safety_monthly.csv"
@@ -2,7 +2,6 @@
 Real-time Governance Data Generator
 Generates governance and compliance metrics continuously
 """
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import time
@@ -10,149 +9,129 @@ import os
 from pathlib import Path
 import json
 
+from realtime_utils import append_row
+
 # Output directory
 OUTPUT_DIR = Path("dataset_realtime/governance")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Seconds between ticks
+REFRESH_INTERVAL = 60
+
+# Random source shared by every generator
+rng = np.random.default_rng()
+
 def generate_board_diversity():
     """Generate quarterly board diversity metrics"""
     today = datetime.now()
     quarter = f"{today.year}-Q{(today.month-1)//3 + 1}"
     
-    data = {
-        "quarter": [quarter],
-        "total_board_members": [np.random.randint(7, 12)],
-        "independent_directors_count": [np.random.randint(4, 8)],
-        "female_directors_count": [np.random.randint(3, 6)],
-        "minority_directors_count": [np.random.randint(2, 5)],
-        "average_tenure_years": [np.random.uniform(3.5, 6.5)],
-        "board_meetings_held": [np.random.randint(4, 8)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "board_diversity_quarterly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        if quarter in existing['quarter'].values:
-            existing = existing[existing['quarter'] != quarter]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(8)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+    header = ["quarter", "total_board_members", "independent_directors_count", "female_directors_count", "minority_directors_count", "average_tenure_years", "board_meetings_held"]
+    # All count fields in one draw
+    total, independent, female, minority, meetings = rng.integers([7, 4, 3, 2, 4], [12, 8, 6, 5, 8]).tolist()
+    row = [
+        quarter,
+        total,
+        independent,
+        female,
+        minority,
+        rng.uniform(3.5, 6.5),
+        meetings
+    ]
+    
+    output_file = OUTPUT_DIR / "board_diversity_quarterly.parquet"
+    # Keep last 8 quarters, one row per quarter
+    return append_row(output_file, header, row, max_rows=8, replace_key=True)
 
 def generate_ethics_compliance():
     """Generate monthly ethics and compliance metrics"""
     today = datetime.now()
     month = today.strftime("%Y-%m")
     
-    data = {
-        "month": [month],
-        "ethics_training_completion_percent": [np.random.uniform(95, 100)],
-        "policy_violations_reported": [np.random.randint(0, 3)],
-        "whistleblower_reports": [np.random.randint(0, 2)],
-        "compliance_audits_completed": [np.random.randint(2, 6)],
-        "corrective_actions_taken": [np.random.randint(0, 4)],
-        "supplier_audits_completed": [np.random.randint(3, 10)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "ethics_compliance_monthly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        if month in existing['month'].values:
-            existing = existing[existing['month'] != month]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(12)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+    header = ["month", "ethics_training_completion_percent", "policy_violations_reported", "whistleblower_reports", "compliance_audits_completed", "corrective_actions_taken", "supplier_audits_completed"]
+    # All count fields in one draw
+    violations, whistleblower, audits, corrective, supplier_audits = rng.integers([0, 0, 2, 0, 3], [3, 2, 6, 4, 10]).tolist()
+    row = [
+        month,
+        rng.uniform(95, 100),
+        violations,
+        whistleblower,
+        audits,
+        corrective,
+        supplier_audits
+    ]
+    
+    output_file = OUTPUT_DIR / "ethics_compliance_monthly.parquet"
+    # Keep last 12 months, one row per month
+    return append_row(output_file, header, row, max_rows=12, replace_key=True)
 
 def generate_risk_management():
     """Generate quarterly risk assessment metrics"""
     today = datetime.now()
     quarter = f"{today.year}-Q{(today.month-1)//3 + 1}"
     
-    data = {
-        "quarter": [quarter],
-        "total_risks_identified": [np.random.randint(15, 30)],
-        "high_priority_risks": [np.random.randint(2, 6)],
-        "medium_priority_risks": [np.random.randint(5, 12)],
-        "risks_mitigated": [np.random.randint(8, 15)],
-        "risk_assessment_score": [np.random.uniform(7.0, 9.0)],
-        "cybersecurity_incidents": [np.random.randint(0, 3)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "risk_management_quarterly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        if quarter in existing['quarter'].values:
-            existing = existing[existing['quarter'] != quarter]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(8)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+    header = ["quarter", "total_risks_identified", "high_priority_risks", "medium_priority_risks", "risks_mitigated", "risk_assessment_score", "cybersecurity_incidents"]
+    # All count fields in one draw
+    identified, high, medium, mitigated, incidents = rng.integers([15, 2, 5, 8, 0], [30, 6, 12, 15, 3]).tolist()
+    row = [
+        quarter,
+        identified,
+        high,
+        medium,
+        mitigated,
+        rng.uniform(7.0, 9.0),
+        incidents
+    ]
+    
+    output_file = OUTPUT_DIR / "risk_management_quarterly.parquet"
+    # Keep last 8 quarters, one row per quarter
+    return append_row(output_file, header, row, max_rows=8, replace_key=True)
 
 def generate_shareholder_engagement():
     """Generate quarterly shareholder engagement metrics"""
     today = datetime.now()
     quarter = f"{today.year}-Q{(today.month-1)//3 + 1}"
     
-    data = {
-        "quarter": [quarter],
-        "shareholder_meetings_held": [np.random.randint(1, 3)],
-        "shareholder_resolutions": [np.random.randint(0, 5)],
-        "voting_participation_percent": [np.random.uniform(75, 92)],
-        "investor_inquiries_received": [np.random.randint(50, 150)],
-        "esg_rating_score": [np.random.uniform(75, 90)],
-        "transparency_index_score": [np.random.uniform(80, 95)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "shareholder_engagement_quarterly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        if quarter in existing['quarter'].values:
-            existing = existing[existing['quarter'] != quarter]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(8)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+    header = ["quarter", "shareholder_meetings_held", "shareholder_resolutions", "voting_participation_percent", "investor_inquiries_received", "esg_rating_score", "transparency_index_score"]
+    # One draw for the count fields and one for the scores
+    meetings, resolutions, inquiries = rng.integers([1, 0, 50], [3, 5, 150]).tolist()
+    participation, esg_rating, transparency = rng.uniform([75, 75, 80], [92, 90, 95]).tolist()
+    row = [
+        quarter,
+        meetings,
+        resolutions,
+        participation,
+        inquiries,
+        esg_rating,
+        transparency
+    ]
+    
+    output_file = OUTPUT_DIR / "shareholder_engagement_quarterly.parquet"
+    # Keep last 8 quarters, one row per quarter
+    return append_row(output_file, header, row, max_rows=8, replace_key=True)
 
 def generate_data_privacy():
     """Generate monthly data privacy and security metrics"""
     today = datetime.now()
     month = today.strftime("%Y-%m")
     
-    data = {
-        "month": [month],
-        "data_breach_incidents": [np.random.randint(0, 1)],
-        "privacy_training_completion_percent": [np.random.uniform(95, 100)],
-        "data_subject_requests": [np.random.randint(5, 20)],
-        "requests_resolved_within_sla": [np.random.randint(5, 20)],
-        "gdpr_compliance_score": [np.random.uniform(90, 100)],
-        "security_patches_applied": [np.random.randint(20, 50)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "data_privacy_monthly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        if month in existing['month'].values:
-            existing = existing[existing['month'] != month]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(12)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+    header = ["month", "data_breach_incidents", "privacy_training_completion_percent", "data_subject_requests", "requests_resolved_within_sla", "gdpr_compliance_score", "security_patches_applied"]
+    # One draw for the count fields and one for the scores
+    breaches, requests, resolved, patches = rng.integers([0, 5, 5, 20], [1, 20, 20, 50]).tolist()
+    training, gdpr = rng.uniform([95, 90], [100, 100]).tolist()
+    row = [
+        month,
+        breaches,
+        training,
+        requests,
+        resolved,
+        gdpr,
+        patches
+    ]
+    
+    output_file = OUTPUT_DIR / "data_privacy_monthly.parquet"
+    # Keep last 12 months, one row per month
+    return append_row(output_file, header, row, max_rows=12, replace_key=True)
 
 def generate_all_governance():
     """Generate all governance metrics"""
@@ -173,10 +152,13 @@ def main():
     """Main loop - generate data every 60 seconds"""
     print("🏛️ Governance Real-time Generator Started")
     print(f"📁 Output directory: {OUTPUT_DIR.absolute()}")
-    print("⏱️  Refresh interval: 60 seconds")
+    print(f"⏱️  Refresh interval: {REFRESH_INTERVAL} seconds")
     print("-" * 60)
     
     iteration = 0
+    # Ticks are scheduled on a fixed monotonic grid so the time spent
+    # generating does not push every later tick back
+    next_deadline = time.monotonic()
     while True:
         iteration += 1
         print(f"\n🔄 Iteration #{iteration}")
@@ -187,8 +169,15 @@ def main():
         except Exception as e:
             print(f"❌ Error generating data: {e}")
         
-        print(f"⏳ Sleeping for 60 seconds...")
-        time.sleep(60)
+        next_deadline += REFRESH_INTERVAL
+        remaining = next_deadline - time.monotonic()
+        if remaining < 0:
+            print(f"⚠️  Tick overran the interval by {-remaining:.1f}s, starting the next one now")
+            next_deadline = time.monotonic()
+            remaining = 0
+        
+        print(f"⏳ Sleeping for {remaining:.1f} seconds...")
+        time.sleep(remaining)
 
 if __name__ == "__main__":
     main()
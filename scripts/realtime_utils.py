@@ -0,0 +1,108 @@
+"""
+Shared helpers for the real-time data generators
+"""
+import os
+from collections import deque
+
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+# Rolling window of rows per output file, loaded from disk on first use
+_windows = {}
+
+
+def _load_window(path, header, max_rows):
+    """Read an existing window from path, or from the CSV written by older versions"""
+    window = deque(maxlen=max_rows)
+    legacy_csv = path.with_suffix(".csv")
+    if path.exists():
+        table = pq.read_table(path)
+    elif legacy_csv.exists():
+        # The header is known, so give every column its type up front instead
+        # of letting the reader infer them; the date/month column stays text,
+        # as in the Parquet files
+        column_types = {name: pa.float64() for name in header[1:]}
+        column_types[header[0]] = pa.string()
+        table = pv.read_csv(legacy_csv, convert_options=pv.ConvertOptions(
+            column_types=column_types,
+            include_columns=header
+        ))
+    else:
+        return window
+    window.extend(map(list, zip(*table.to_pydict().values())))
+    return window
+
+
+def serialize_table(table):
+    """Encode a table as a complete zstd-compressed Parquet file in memory"""
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, compression="zstd")
+    return sink.getvalue()
+
+
+def write_atomic(path, data):
+    """
+    Replace path with data using a single write to a temporary file
+    
+    The Parquet writer emits many small writes (pages, column chunks, footer)
+    when given a path; encoding to memory first turns that into one
+    open/write/close per file.
+    """
+    tmp_path = path.with_suffix(".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def append_row(path, header, row, max_rows, replace_key=False, types=None):
+    """
+    Add one row to a rolling Parquet file
+    
+    The window is kept in memory between ticks, so the file is only ever
+    written, never re-read. Each call encodes the whole window in memory,
+    writes it to a temporary file in one go and swaps it in atomically, so
+    readers always see a complete file (a ParquetWriter's footer is not
+    written until close).
+    
+    Args:
+        path: Parquet file to write
+        header: Column names
+        row: Values for the new row
+        max_rows: Number of most recent rows to keep
+        replace_key: Keep one row per key: overwrite the last row instead
+            of appending when its first column (e.g. the month) matches the
+            new row's. Rows with that key elsewhere in the file are dropped
+            when it is first loaded
+        types: Optional pyarrow types for the columns after the first, to
+            store them narrower than the float64/int64 inferred by default
+    
+    Returns:
+        Number of rows in the file
+    """
+    window = _windows.get(path)
+    if window is None:
+        window = _load_window(path, header, max_rows)
+        if replace_key:
+            # A file written by an older version may hold the new row's key
+            # anywhere, so drop every such row once; after that only the
+            # last row can match
+            window = deque((r for r in window if r[0] != row[0]), maxlen=max_rows)
+        _windows[path] = window
+    
+    if replace_key and window and window[-1][0] == row[0]:
+        window[-1] = row
+    else:
+        window.append(row)
+    
+    table = pa.table(dict(zip(header, map(list, zip(*window)))))
+    if types is not None:
+        # Cast the whole table so rows loaded from older, wider files match
+        table = table.cast(pa.schema([(header[0], pa.string())] + list(zip(header[1:], types))))
+    write_atomic(path, serialize_table(table))
+    return len(window)
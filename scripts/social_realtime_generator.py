@@ -2,164 +2,152 @@
 Real-time Social Impact Data Generator
 Generates social and community metrics continuously
 """
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import pyarrow as pa
 from datetime import datetime, timedelta
 import time
 import os
 from pathlib import Path
 import json
 
+from realtime_utils import append_row
+
 # Output directory
 OUTPUT_DIR = Path("dataset_realtime/social")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-def generate_employee_satisfaction():
-    """Generate monthly employee satisfaction scores"""
-    today = datetime.now()
-    month = today.strftime("%Y-%m")
-    
-    data = {
-        "month": [month],
-        "overall_satisfaction_score": [np.random.uniform(7.5, 9.0)],
-        "work_life_balance_score": [np.random.uniform(7.0, 8.5)],
-        "career_growth_score": [np.random.uniform(7.2, 8.8)],
-        "management_score": [np.random.uniform(7.5, 8.9)],
-        "response_rate_percent": [np.random.uniform(75, 95)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "employee_satisfaction_monthly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        if month in existing['month'].values:
-            existing = existing[existing['month'] != month]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(12)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+# Seconds between ticks
+REFRESH_INTERVAL = 60
 
-def generate_diversity_metrics():
-    """Generate quarterly diversity and inclusion metrics"""
-    today = datetime.now()
-    quarter = f"{today.year}-Q{(today.month-1)//3 + 1}"
-    
-    data = {
-        "quarter": [quarter],
-        "female_employees_percent": [np.random.uniform(42, 52)],
-        "minority_employees_percent": [np.random.uniform(35, 45)],
-        "women_leadership_percent": [np.random.uniform(38, 48)],
-        "pay_equity_ratio": [np.random.uniform(0.95, 1.00)],
-        "total_employees": [np.random.randint(450, 550)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "diversity_metrics_quarterly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        if quarter in existing['quarter'].values:
-            existing = existing[existing['quarter'] != quarter]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(8)  # Keep last 2 years
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+# Threads writing the metric files; each file is only touched by one task per tick
+IO_POOL = ThreadPoolExecutor(max_workers=5)
 
-def generate_training_hours():
-    """Generate monthly training and development hours"""
-    today = datetime.now()
-    month = today.strftime("%Y-%m")
-    
-    data = {
-        "month": [month],
-        "total_training_hours": [np.random.uniform(800, 1500)],
-        "hours_per_employee": [np.random.uniform(1.5, 3.0)],
-        "technical_training_hours": [np.random.uniform(400, 800)],
-        "leadership_training_hours": [np.random.uniform(200, 400)],
-        "safety_training_hours": [np.random.uniform(200, 300)],
-        "employees_trained": [np.random.randint(400, 500)]
+# Every metric's output file, time key, number of rows kept (12 months or
+# 8 quarters, one row per period) and random fields as (column, kind, low, high);
+# "int" fields follow np.random.randint and never reach high
+METRICS = [
+    {
+        "name": "employee_satisfaction",
+        "file": "employee_satisfaction_monthly.parquet",
+        "period": "month",
+        "keep": 12,
+        "cols": [
+            ("overall_satisfaction_score", "uniform", 7.5, 9.0),
+            ("work_life_balance_score", "uniform", 7.0, 8.5),
+            ("career_growth_score", "uniform", 7.2, 8.8),
+            ("management_score", "uniform", 7.5, 8.9),
+            ("response_rate_percent", "uniform", 75, 95)
+        ]
+    },
+    {
+        "name": "diversity_metrics",
+        "file": "diversity_metrics_quarterly.parquet",
+        "period": "quarter",
+        "keep": 8,
+        "cols": [
+            ("female_employees_percent", "uniform", 42, 52),
+            ("minority_employees_percent", "uniform", 35, 45),
+            ("women_leadership_percent", "uniform", 38, 48),
+            ("pay_equity_ratio", "uniform", 0.95, 1.00),
+            ("total_employees", "int", 450, 550)
+        ]
+    },
+    {
+        "name": "training_hours",
+        "file": "training_hours_monthly.parquet",
+        "period": "month",
+        "keep": 12,
+        "cols": [
+            ("total_training_hours", "uniform", 800, 1500),
+            ("hours_per_employee", "uniform", 1.5, 3.0),
+            ("technical_training_hours", "uniform", 400, 800),
+            ("leadership_training_hours", "uniform", 200, 400),
+            ("safety_training_hours", "uniform", 200, 300),
+            ("employees_trained", "int", 400, 500)
+        ]
+    },
+    {
+        "name": "community_investment",
+        "file": "community_investment_quarterly.parquet",
+        "period": "quarter",
+        "keep": 8,
+        "cols": [
+            ("total_investment_usd", "uniform", 50000, 150000),
+            ("education_programs_usd", "uniform", 20000, 60000),
+            ("environmental_initiatives_usd", "uniform", 15000, 50000),
+            ("local_business_support_usd", "uniform", 10000, 40000),
+            ("volunteer_hours", "uniform", 500, 1200),
+            ("beneficiaries_count", "int", 1000, 3000)
+        ]
+    },
+    {
+        "name": "safety_incidents",
+        "file": "safety_incidents_monthly.parquet",
+        "period": "month",
+        "keep": 12,
+        "cols": [
+            ("total_incidents", "int", 0, 5),
+            ("lost_time_incidents", "int", 0, 2),
+            ("near_misses_reported", "int", 5, 20),
+            ("safety_training_completion_percent", "uniform", 92, 100),
+            ("days_without_incident", "int", 15, 90)
+        ]
     }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "training_hours_monthly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        if month in existing['month'].values:
-            existing = existing[existing['month'] != month]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(12)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+]
 
-def generate_community_investment():
-    """Generate quarterly community investment"""
-    today = datetime.now()
-    quarter = f"{today.year}-Q{(today.month-1)//3 + 1}"
-    
-    data = {
-        "quarter": [quarter],
-        "total_investment_usd": [np.random.uniform(50000, 150000)],
-        "education_programs_usd": [np.random.uniform(20000, 60000)],
-        "environmental_initiatives_usd": [np.random.uniform(15000, 50000)],
-        "local_business_support_usd": [np.random.uniform(10000, 40000)],
-        "volunteer_hours": [np.random.uniform(500, 1200)],
-        "beneficiaries_count": [np.random.randint(1000, 3000)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "community_investment_quarterly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        if quarter in existing['quarter'].values:
-            existing = existing[existing['quarter'] != quarter]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(8)
-    
-    df.to_csv(output_file, index=False)
-    return len(df)
+# Random source shared by every metric
+rng = np.random.default_rng()
 
-def generate_safety_incidents():
-    """Generate monthly workplace safety incidents"""
-    today = datetime.now()
-    month = today.strftime("%Y-%m")
-    
-    data = {
-        "month": [month],
-        "total_incidents": [np.random.randint(0, 5)],
-        "lost_time_incidents": [np.random.randint(0, 2)],
-        "near_misses_reported": [np.random.randint(5, 20)],
-        "safety_training_completion_percent": [np.random.uniform(92, 100)],
-        "days_without_incident": [np.random.randint(15, 90)]
-    }
-    
-    df = pd.DataFrame(data)
-    output_file = OUTPUT_DIR / "safety_incidents_monthly.csv"
-    
-    if output_file.exists():
-        existing = pd.read_csv(output_file)
-        if month in existing['month'].values:
-            existing = existing[existing['month'] != month]
-        df = pd.concat([existing, df], ignore_index=True)
-        df = df.tail(12)
+# All bounds concatenated so one rng.uniform call per tick draws every metric,
+# and the slice of that draw belonging to each metric
+_fields = [field for metric in METRICS for field in metric["cols"]]
+ALL_LOW = np.array([low for _, _, low, _ in _fields])
+ALL_HIGH = np.array([high for _, _, _, high in _fields])
+ALL_INTEGER = np.array([kind == "int" for _, kind, _, _ in _fields])
+SLICES = {}
+_offset = 0
+for _metric in METRICS:
+    SLICES[_metric["name"]] = slice(_offset, _offset + len(_metric["cols"]))
+    _offset += len(_metric["cols"])
+
+# Stored column types: every score, percentage and amount fits float32 and
+# every count stays well below 65535, so the files need not hold 64-bit values
+COLUMN_TYPES = {
+    metric["name"]: [pa.uint16() if kind == "int" else pa.float32() for _, kind, _, _ in metric["cols"]]
+    for metric in METRICS
+}
+
+def generate_metric(metric, periods, values):
+    """Write this tick's row of one metric, replacing the row of the current period"""
+    header = [metric["period"]] + [column for column, _, _, _ in metric["cols"]]
+    row = [periods[metric["period"]]] + values
     
-    df.to_csv(output_file, index=False)
-    return len(df)
+    output_file = OUTPUT_DIR / metric["file"]
+    return append_row(output_file, header, row, max_rows=metric["keep"], replace_key=True, types=COLUMN_TYPES[metric["name"]])
 
 def generate_all_social():
     """Generate all social metrics"""
-    metrics = {
-        "employee_satisfaction": generate_employee_satisfaction(),
-        "diversity_metrics": generate_diversity_metrics(),
-        "training_hours": generate_training_hours(),
-        "community_investment": generate_community_investment(),
-        "safety_incidents": generate_safety_incidents()
+    # One clock read per tick, shared by every metric
+    today = datetime.now()
+    periods = {
+        "month": today.strftime("%Y-%m"),
+        "quarter": f"{today.year}-Q{(today.month-1)//3 + 1}"
+    }
+    
+    # Draw the random fields of every metric at once; whole-number fields are
+    # floored, which matches randint over [low, high)
+    draws = rng.uniform(ALL_LOW, ALL_HIGH)
+    values = draws.astype(object)
+    values[ALL_INTEGER] = np.floor(draws[ALL_INTEGER]).astype(np.int64)
+    values = values.tolist()
+    
+    # Write the metric files concurrently
+    futures = {
+        metric["name"]: IO_POOL.submit(generate_metric, metric, periods, values[SLICES[metric["name"]]])
+        for metric in METRICS
     }
+    metrics = {name: future.result() for name, future in futures.items()}
     
     timestamp = datetime.now().isoformat()
     print(f"[{timestamp}] Generated social metrics: {json.dumps(metrics, indent=2)}")
@@ -170,22 +158,32 @@ def main():
     """Main loop - generate data every 60 seconds"""
     print("🤝 Social Impact Real-time Generator Started")
     print(f"📁 Output directory: {OUTPUT_DIR.absolute()}")
-    print("⏱️  Refresh interval: 60 seconds")
+    print(f"⏱️  Refresh interval: {REFRESH_INTERVAL} seconds")
     print("-" * 60)
     
     iteration = 0
+    # Ticks are scheduled on a fixed monotonic grid so the time spent
+    # generating does not push every later tick back
+    next_deadline = time.monotonic()
     while True:
         iteration += 1
         print(f"\n🔄 Iteration #{iteration}")
         
         try:
             metrics = generate_all_social()
-            print(f"✅ Successfully generated {sum(metrics.values())} total rows across 5 metrics")
+            print(f"✅ Successfully generated {sum(metrics.values())} total rows across {len(METRICS)} metrics")
         except Exception as e:
             print(f"❌ Error generating data: {e}")
         
-        print(f"⏳ Sleeping for 60 seconds...")
-        time.sleep(60)
+        next_deadline += REFRESH_INTERVAL
+        remaining = next_deadline - time.monotonic()
+        if remaining < 0:
+            print(f"⚠️  Tick overran the interval by {-remaining:.1f}s, starting the next one now")
+            next_deadline = time.monotonic()
+            remaining = 0
+        
+        print(f"⏳ Sleeping for {remaining:.1f} seconds...")
+        time.sleep(remaining)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,233 @@
+"""
+Shared SQLite helpers for the database build scripts
+"""
+import csv
+import hashlib
+import os
+import sqlite3
+from contextlib import closing
+from itertools import islice
+from pathlib import Path
+
+import pandas as pd
+
+# Tuning applied to every connection that builds a database
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",      # 64 MB page cache
+    "PRAGMA mmap_size=268435456",    # 256 MB memory map
+)
+
+# Used instead when the file is built from scratch: nobody else can be
+# reading it and a crashed build is simply re-run, so skip journaling and
+# locking entirely. page_size only takes effect before the first table.
+BUILD_PRAGMAS = (
+    "PRAGMA page_size=8192",
+    "PRAGMA locking_mode=EXCLUSIVE",
+    "PRAGMA journal_mode=OFF",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# SQLITE_MAX_VARIABLE_NUMBER on older builds
+MAX_VARIABLES = 999
+
+# Time-bucket columns the dashboards filter and sort on
+TIME_COLUMNS = ("quarter", "month", "date", "year_month")
+
+
+def _remove_database(db_path) -> None:
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(f"{db_path}{suffix}"):
+            os.remove(f"{db_path}{suffix}")
+
+
+def _apply_pragmas(conn: sqlite3.Connection, pragmas, schema: str = "main") -> None:
+    for pragma in pragmas:
+        # temp_store is connection-wide and takes no schema prefix
+        if schema != "main" and "temp_store" not in pragma:
+            pragma = pragma.replace("PRAGMA ", f"PRAGMA {schema}.", 1)
+        conn.execute(pragma)
+
+
+def connect(db_path, fresh: bool = False) -> sqlite3.Connection:
+    """
+    Open a database connection with the bulk-write PRAGMAs applied
+    
+    Args:
+        db_path: Path to the SQLite database file
+        fresh: Delete any existing database (and its WAL files) first and
+            build it with BUILD_PRAGMAS; call finish_build() after the last commit
+    """
+    if fresh:
+        _remove_database(db_path)
+    conn = sqlite3.connect(db_path)
+    _apply_pragmas(conn, BUILD_PRAGMAS if fresh else PRAGMAS)
+    return conn
+
+
+def attach(conn: sqlite3.Connection, db_path, schema: str, fresh: bool = False) -> None:
+    """
+    Attach another database file to conn under schema, with the same PRAGMAs as connect()
+    
+    Writing several files through one connection lets them share a page
+    cache and a single transaction.
+    """
+    if fresh:
+        _remove_database(db_path)
+    conn.execute("ATTACH DATABASE ? AS " + schema, (str(db_path),))
+    _apply_pragmas(conn, BUILD_PRAGMAS if fresh else PRAGMAS, schema)
+
+
+def finish_build(conn: sqlite3.Connection, schema: str = "main") -> None:
+    """Switch a database opened with fresh=True to WAL for runtime use"""
+    _apply_pragmas(conn, (
+        "PRAGMA locking_mode=NORMAL",
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+    ), schema)
+
+
+def csv_fingerprint(paths) -> str:
+    """SHA-256 over the names and contents of the input files, in order"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode() + b"\0")
+        with open(path, "rb") as f:
+            digest.update(hashlib.file_digest(f, "sha256").digest())
+    return digest.hexdigest()
+
+
+def read_fingerprint(db_path):
+    """Return the input fingerprint stored by write_fingerprint(), or None"""
+    if not os.path.exists(db_path):
+        return None
+    try:
+        uri = Path(db_path).absolute().as_uri() + "?mode=ro"
+        with closing(sqlite3.connect(uri, uri=True)) as conn:
+            row = conn.execute(
+                "SELECT value FROM _build_meta WHERE name = 'input_fingerprint'"
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def write_fingerprint(conn: sqlite3.Connection, fingerprint: str) -> None:
+    """Record the fingerprint of the inputs a database was built from (does not commit)"""
+    conn.execute("CREATE TABLE IF NOT EXISTS _build_meta (name TEXT PRIMARY KEY, value TEXT)")
+    conn.execute(
+        "INSERT OR REPLACE INTO _build_meta (name, value) VALUES ('input_fingerprint', ?)",
+        (fingerprint,)
+    )
+
+
+def _column_types(rows, n_columns: int):
+    """
+    Pick the column types DataFrame.to_sql would give the columns of a CSV
+    
+    Works in one pass over rows, keeping only per-column state.
+    
+    Returns:
+        (list of SQL types, number of rows)
+    """
+    types = ["INTEGER"] * n_columns
+    has_gaps = [False] * n_columns
+    row_count = 0
+    for row in rows:
+        row_count += 1
+        for i, value in enumerate(row):
+            if value == "":
+                has_gaps[i] = True
+                continue
+            if types[i] == "INTEGER":
+                try:
+                    int(value)
+                except ValueError:
+                    types[i] = "REAL"
+            if types[i] == "REAL":
+                try:
+                    float(value)
+                except ValueError:
+                    types[i] = "TEXT"
+    if not row_count:
+        return ["TEXT"] * n_columns, 0
+    # pandas reads an integer column with gaps as float
+    types = ["REAL" if t == "INTEGER" and gaps else t for t, gaps in zip(types, has_gaps)]
+    return types, row_count
+
+
+def import_csv(conn: sqlite3.Connection, csv_path, table_name: str) -> int:
+    """
+    Replace table_name with the rows of a CSV file, without going through pandas
+    
+    Column types are inferred the way read_csv + to_sql would, and SQLite's
+    type affinity converts the text fields on insert. Empty fields become NULL.
+    The file is streamed twice (once to infer types, once to insert) so
+    memory use does not grow with its size. Like write_table() this does
+    not commit.
+    
+    Returns:
+        Number of rows imported
+    """
+    with open(csv_path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        types, row_count = _column_types(reader, len(header))
+    columns = ",\n  ".join(f'"{name}" {sql_type}' for name, sql_type in zip(header, types))
+    
+    conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+    conn.execute(f'CREATE TABLE "{table_name}" (\n{columns}\n)')
+    with open(csv_path, newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        conn.executemany(
+            f'INSERT INTO "{table_name}" VALUES ({", ".join("?" * len(header))})',
+            ([None if v == "" else v for v in row] for row in reader)
+        )
+    return row_count
+
+
+def index_time_columns(conn: sqlite3.Connection, table_name: str) -> None:
+    """Index every TIME_COLUMNS column of table_name (run ANALYZE afterwards)"""
+    for _, column, *_ in conn.execute(f'PRAGMA table_info("{table_name}")').fetchall():
+        if column in TIME_COLUMNS:
+            conn.execute(
+                f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_{column}" ON "{table_name}" ("{column}")'
+            )
+
+
+def write_table(conn: sqlite3.Connection, df: pd.DataFrame, table_name: str) -> None:
+    """
+    Replace table_name with the contents of df
+    
+    Unlike DataFrame.to_sql this does not commit, so several tables can be
+    written inside one transaction opened by the caller.
+    """
+    conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+    conn.execute(pd.io.sql.get_schema(df, table_name, con=conn))
+    
+    df = df.copy(deep=False)
+    # Store datetimes the way to_sql does (ISO 8601 with a space separator)
+    for col in df.select_dtypes(include=['datetime', 'datetimetz']).columns:
+        df[col] = [None if pd.isna(v) else v.isoformat(" ") for v in df[col]]
+    
+    # Multi-row INSERTs, staying under SQLite's default 999 bound parameters
+    rows_per_insert = max(1, MAX_VARIABLES // max(1, len(df.columns)))
+    columns = ", ".join(f'"{col}"' for col in df.columns)
+    row_placeholder = "(" + ", ".join("?" for _ in df.columns) + ")"
+    insert_sql = f'INSERT INTO "{table_name}" ({columns}) VALUES '
+    
+    rows = df.itertuples(index=False, name=None)
+    while True:
+        chunk = list(islice(rows, rows_per_insert))
+        if not chunk:
+            break
+        conn.execute(
+            insert_sql + ", ".join([row_placeholder] * len(chunk)),
+            [value for row in chunk for value in row]
+        )
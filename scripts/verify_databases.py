@@ -1,60 +1,167 @@
 """
 Verify all three SQLite databases exist and have proper structure
 """
+import argparse
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def verify_database(db_name):
-    """Verify database structure"""
-    db_path = Path(db_name)
+def stat_row_counts(cursor):
+    """
+    Row counts recorded by the last ANALYZE, keyed by table name
     
-    print(f"\n{'='*80}")
-    print(f"DATABASE: {db_name}")
-    print(f"{'='*80}")
+    The first number of every sqlite_stat1 entry is the table's row count.
+    Returns an empty dict if the database was never analyzed.
+    """
+    try:
+        cursor.execute("SELECT tbl, stat FROM sqlite_stat1")
+    except sqlite3.OperationalError:
+        return {}
+    return {table_name: int(stat.split()[0]) for table_name, stat in cursor.fetchall()}
+
+def connect_readonly(db_path):
+    """Open a database read-only, so verifying can never create or modify one"""
+    conn = sqlite3.connect(db_path.absolute().as_uri() + "?mode=ro", uri=True)
+    conn.execute("PRAGMA query_only=1")
+    # 64 MB page cache and a 256 MB memory map for the schema and count scans
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+def check_file(db_path, log):
+    """Log the report header and whether db_path is a non-empty file"""
+    log(f"\n{'='*80}")
+    log(f"DATABASE: {db_path}")
+    log(f"{'='*80}")
     
     if not db_path.exists():
-        print(f"❌ {db_name} does NOT exist!")
+        log(f"❌ {db_path} does NOT exist!")
         return False
     
-    print(f"✅ File exists: {db_path.stat().st_size:,} bytes")
+    size = db_path.stat().st_size
+    if size == 0:
+        log(f"❌ {db_path} is empty!")
+        return False
+    
+    log(f"✅ File exists: {size:,} bytes")
+    return True
+
+def verify_exists(db_name):
+    """
+    Quick check that a database file exists and holds at least one table
+    
+    Only sqlite_master is read, so this costs the same however many rows
+    the tables hold.
+    
+    Returns:
+        (True if the database exists and has tables, list of report lines)
+    """
+    db_path = Path(db_name)
+    report = []
+    log = report.append
+    
+    if not check_file(db_path, log):
+        return False, report
     
     try:
-        conn = sqlite3.connect(db_name)
+        conn = connect_readonly(db_path)
+        # Skip internal bookkeeping tables, as llm/db_client.py does
+        tables = [name for name, in conn.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table'
+            AND name NOT LIKE '\\_%' ESCAPE '\\'
+            AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\'
+            ORDER BY name
+        """)]
+        conn.close()
+    except Exception as e:
+        log(f"❌ Error reading {db_name}: {e}")
+        return False, report
+    
+    if not tables:
+        log(f"⚠️  No tables found in {db_name}")
+        return False, report
+    
+    log(f"\nTables ({len(tables)}): {', '.join(tables)}")
+    return True, report
+
+def verify_full(db_name):
+    """
+    Verify database structure, with the row count and columns of every table
+    
+    The report is collected rather than printed so that several databases
+    can be checked in parallel without their output interleaving.
+    
+    Returns:
+        (True if the database exists and has tables, list of report lines)
+    """
+    db_path = Path(db_name)
+    report = []
+    log = report.append
+    
+    if not check_file(db_path, log):
+        return False, report
+    
+    try:
+        conn = connect_readonly(db_path)
         cursor = conn.cursor()
         
-        # Get all tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-        tables = cursor.fetchall()
+        # Get every table with its columns in one query, skipping internal
+        # bookkeeping tables
+        cursor.execute("""
+            SELECT m.name, c.name
+            FROM sqlite_master AS m
+            JOIN pragma_table_info(m.name) AS c
+            WHERE m.type = 'table'
+            AND m.name NOT LIKE '\\_%' ESCAPE '\\'
+            AND m.name NOT LIKE 'sqlite\\_%' ESCAPE '\\'
+            ORDER BY m.name, c.cid
+        """)
+        tables = {}
+        for table_name, column_name in cursor.fetchall():
+            tables.setdefault(table_name, []).append(column_name)
         
         if not tables:
-            print(f"⚠️  No tables found in {db_name}")
+            log(f"⚠️  No tables found in {db_name}")
             conn.close()
-            return False
+            return False, report
+        
+        log(f"\nTables ({len(tables)}):")
         
-        print(f"\nTables ({len(tables)}):")
+        # Counts are only reported, so the ANALYZE ones are good enough; scan
+        # just the tables they do not cover
+        stat_counts = stat_row_counts(cursor)
         
-        for table_name, in tables:
+        for table_name, column_names in tables.items():
             # Get row count
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            row_count = cursor.fetchone()[0]
-            
-            # Get column info
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
-            column_names = [col[1] for col in columns]
+            row_count = stat_counts.get(table_name)
+            source = " (from sqlite_stat1)"
+            if row_count is None:
+                quoted_name = '"' + table_name.replace('"', '""') + '"'
+                cursor.execute(f"SELECT COUNT(*) FROM {quoted_name}")
+                row_count = cursor.fetchone()[0]
+                source = ""
             
-            print(f"\n  📊 {table_name}")
-            print(f"     Rows: {row_count:,}")
-            print(f"     Columns ({len(column_names)}): {', '.join(column_names)}")
+            log(f"\n  📊 {table_name}")
+            log(f"     Rows: {row_count:,}{source}")
+            log(f"     Columns ({len(column_names)}): {', '.join(column_names)}")
         
         conn.close()
-        return True
+        return True, report
         
     except Exception as e:
-        print(f"❌ Error reading {db_name}: {e}")
-        return False
+        log(f"❌ Error reading {db_name}: {e}")
+        return False, report
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Verify the three SQLite databases exist and have tables.")
+    parser.add_argument("-v", "--full", action="store_true", help="Also report the row count and columns of every table.")
+    return parser.parse_args()
 
 if __name__ == "__main__":
+    args = parse_args()
+    verify = verify_full if args.full else verify_exists
+    
     print("\n🔍 VERIFYING ALL DATABASES")
     print("="*80)
     
@@ -66,8 +173,12 @@ if __name__ == "__main__":
     
     results = {}
     
-    for db in databases:
-        results[db] = verify_database(db)
+    # The databases are separate files, so check them concurrently and print
+    # each report in order once it is ready
+    with ThreadPoolExecutor(max_workers=len(databases)) as pool:
+        for db, (success, report) in zip(databases, pool.map(verify, databases)):
+            print("\n".join(report))
+            results[db] = success
     
     print("\n" + "="*80)
     print("SUMMARY")
@@ -79,7 +190,10 @@ if __name__ == "__main__":
     
     all_good = all(results.values())
     
-    if all_good:
+    if all_good and args.full:
         print("\n✅ All three databases are present and have data!")
+    elif all_good:
+        # The quick check never looks at rows, so only claim what it saw
+        print("\n✅ All three databases are present and have tables!")
     else:
         print("\n⚠️  Some databases are missing or empty!")